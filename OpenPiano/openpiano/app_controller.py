@@ -211,7 +211,7 @@ class PianoAppController(QObject):
         self._available_programs: dict[int, list[int]] = {}
         self._available_program_names: dict[int, dict[int, str]] = {}
         self._tutorial_active = False
-        self._tutorial_steps: list[TutorialStep] = []
+        self._tutorial_steps: tuple[TutorialStep, ...] = ()
         self._tutorial_index = 0
         self._tutorial_prev_settings_open = False
         self._tutorial_prev_controls_open = False
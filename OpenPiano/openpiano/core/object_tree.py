@@ -11,3 +11,15 @@ def is_descendant_of(child: object, ancestor: object) -> bool:
             return False
         current = parent_getter()
     return False
+
+
+def has_ancestor_in(child: object, ancestor_ids: set[int]) -> bool:
+    current = child
+    while current is not None:
+        if id(current) in ancestor_ids:
+            return True
+        parent_getter = getattr(current, "parent", None)
+        if not callable(parent_getter):
+            return False
+        current = parent_getter()
+    return False
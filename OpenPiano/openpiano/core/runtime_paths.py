@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import os
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Iterable
 
@@ -10,6 +11,7 @@ def project_root() -> Path:
     return Path(__file__).resolve().parents[2]
 
 
+@lru_cache(maxsize=1)
 def executable_dir() -> Path:
     return Path(sys.executable).resolve().parent
 
@@ -38,6 +38,10 @@ _UPDATE_ALLOWED_HOSTS = {
     "github-releases.githubusercontent.com",
 }
 _VALID_UPDATE_CHANNELS = {"stable", "nightly"}
+_MANIFEST_VERSION_KEYS = ("version", "latest", "app_version")
+_MANIFEST_SETUP_URL_KEYS = ("url-update", "url_update", "setup_url")
+_MANIFEST_SETUP_SHA256_KEYS = ("setup-sha256", "setup_sha256")
+_MANIFEST_SETUP_SIZE_KEYS = ("setup-size", "setup_size")
 _REQUEST_RETRIES = 3
 _REQUEST_RETRY_DELAY_SECONDS = 0.5
 _UPDATE_STAGING_PREFIX = "openpiano-update-"
@@ -70,6 +74,14 @@ def _ensure_not_stopped(stop_event: Event | None) -> None:
         raise InterruptedError("Update operation stopped.")
 
 
+def _wait_before_retry(stop_event: Event | None, delay: float) -> None:
+    if stop_event is None:
+        time.sleep(delay)
+        return
+    if stop_event.wait(delay):
+        raise InterruptedError("Update operation stopped.")
+
+
 def _safe_int(value: object) -> int:
     try:
         parsed = int(value)
@@ -335,7 +347,7 @@ class SelfUpdater:
     def _fetch_manifest(self, *, stop_event: Event | None = None) -> UpdateManifest:
         if not _url_allowed(self._manifest_url, allowed_hosts=_MANIFEST_ALLOWED_HOSTS):
             raise RuntimeError("Manifest URL is missing or untrusted.")
-        payload, _ = self._request_text(self._manifest_url, stop_event=stop_event)
+        payload, _ = self._request_bytes(self._manifest_url, stop_event=stop_event)
         data = json.loads(payload)
         if not isinstance(data, dict):
             raise RuntimeError("latest.json did not return a JSON object")
@@ -364,14 +376,14 @@ class SelfUpdater:
                     return data.get(key)
             return ""
 
-        version_candidate = (
-            source.get("version")
-            or source.get("latest")
-            or source.get("app_version")
-            or data.get("version")
-            or data.get("latest")
-            or data.get("app_version")
-            or ""
+        version_candidate = next(
+            (
+                value
+                for mapping in (source, data)
+                for key in _MANIFEST_VERSION_KEYS
+                if (value := mapping.get(key))
+            ),
+            "",
         )
         if not isinstance(version_candidate, str):
             raise RuntimeError("latest.json did not contain a semantic version string")
@@ -382,11 +394,11 @@ class SelfUpdater:
             allowed_hosts=_UPDATE_ALLOWED_HOSTS,
         ) or self._page_url
         setup_url = _sanitize_url(
-            _pick_value("url-update", "url_update", "setup_url"),
+            _pick_value(*_MANIFEST_SETUP_URL_KEYS),
             allowed_hosts=_UPDATE_ALLOWED_HOSTS,
         ) or _sanitize_url(self._default_setup_url, allowed_hosts=_UPDATE_ALLOWED_HOSTS)
-        setup_sha256 = _sanitize_sha256(_pick_value("setup-sha256", "setup_sha256"))
-        setup_size = _safe_int(_pick_value("setup-size", "setup_size"))
+        setup_sha256 = _sanitize_sha256(_pick_value(*_MANIFEST_SETUP_SHA256_KEYS))
+        setup_size = _safe_int(_pick_value(*_MANIFEST_SETUP_SIZE_KEYS))
         released = str(_pick_value("released") or "").strip()
         notes = _sanitize_notes(_pick_value("notes"))
         minimum_supported = normalize_version(
@@ -407,7 +419,7 @@ class SelfUpdater:
             minimum_supported_version=minimum_supported,
         )
 
-    def _request_text(self, url: str, *, stop_event: Event | None = None) -> tuple[str, str]:
+    def _request_bytes(self, url: str, *, stop_event: Event | None = None) -> tuple[bytes, str]:
         _ensure_not_stopped(stop_event)
         request = Request(
             url=url,
@@ -421,9 +433,8 @@ class SelfUpdater:
         )
         if not _url_allowed(final_url, allowed_hosts=_UPDATE_ALLOWED_HOSTS):
             raise RuntimeError("Update endpoint redirected to an untrusted host.")
-        body = payload.decode("utf-8-sig", errors="replace")
         _ensure_not_stopped(stop_event)
-        return body, final_url
+        return payload, final_url
 
     def _request_with_retries(
         self,
@@ -449,7 +460,7 @@ class SelfUpdater:
             except Exception as exc:
                 last_error = exc
                 if attempt < attempts and delay_base > 0:
-                    time.sleep(delay_base * attempt)
+                    _wait_before_retry(stop_event, delay_base * attempt)
         if last_error is not None:
             raise last_error
         raise RuntimeError("Update request failed.")
@@ -518,7 +529,7 @@ class SelfUpdater:
                 except Exception:
                     pass
                 if attempt < attempts and delay_base > 0:
-                    time.sleep(delay_base * attempt)
+                    _wait_before_retry(stop_event, delay_base * attempt)
         else:
             if last_error is not None:
                 raise last_error
@@ -10,6 +10,8 @@ from openpiano.core.instrument_registry import (
     InstrumentInfo,
 )
 
+_DOWNLOAD_CHUNK_BYTES = 256 * 1024
+
 
 def normalized_soundfont_stem(path: Path) -> str:
     return "".join(ch for ch in path.stem.lower() if ch.isalnum())
@@ -44,8 +46,7 @@ def download_file_with_retries(
         if stop_event is not None and stop_event.is_set():
             raise InterruptedError("SoundFont download canceled.")
         try:
-            if temp_path.exists():
-                temp_path.unlink()
+            temp_path.unlink(missing_ok=True)
             with urllib.request.urlopen(request, timeout=timeout) as response, temp_path.open("wb") as target:
                 total_raw = str(response.headers.get("Content-Length", "")).strip()
                 try:
@@ -58,7 +59,7 @@ def download_file_with_retries(
                 while True:
                     if stop_event is not None and stop_event.is_set():
                         raise InterruptedError("SoundFont download canceled.")
-                    chunk = response.read(1024 * 1024)
+                    chunk = response.read(_DOWNLOAD_CHUNK_BYTES)
                     if not chunk:
                         break
                     target.write(chunk)
@@ -73,22 +74,22 @@ def download_file_with_retries(
                         else:
                             mb = downloaded / (1024.0 * 1024.0)
                             progress_callback(0, f"Downloading SoundFont... {mb:.1f} MB")
+            if stop_event is not None and stop_event.is_set():
+                raise InterruptedError("SoundFont download canceled.")
             temp_path.replace(target_path)
             if progress_callback is not None:
                 progress_callback(100, "SoundFont download complete.")
             return
         except InterruptedError:
             try:
-                if temp_path.exists():
-                    temp_path.unlink()
+                temp_path.unlink(missing_ok=True)
             except Exception:
                 pass
             raise
         except Exception as exc:
             last_error = exc
             try:
-                if temp_path.exists():
-                    temp_path.unlink()
+                temp_path.unlink(missing_ok=True)
             except Exception:
                 pass
             if attempt < attempts:
@@ -10,7 +10,7 @@ TutorialStep: TypeAlias = dict[str, str | bool]
 class TutorialFlowService:
     def __init__(self) -> None:
         self._active = False
-        self._steps: list[TutorialStep] = []
+        self._steps: tuple[TutorialStep, ...] = ()
         self._index = 0
 
     @staticmethod
@@ -159,13 +159,13 @@ class TutorialFlowService:
         if not steps:
             return False
         self._active = True
-        self._steps = steps
+        self._steps = tuple(steps)
         self._index = 0
         return True
 
     def end(self) -> None:
         self._active = False
-        self._steps = []
+        self._steps = ()
         self._index = 0
 
     @property
@@ -173,8 +173,8 @@ class TutorialFlowService:
         return self._active
 
     @property
-    def steps(self) -> list[TutorialStep]:
-        return list(self._steps)
+    def steps(self) -> tuple[TutorialStep, ...]:
+        return self._steps
 
     @property
     def index(self) -> int:
@@ -26,7 +26,8 @@ class UpdateCheckService:
         self._app_name = str(app_name or "").strip() or "OpenPiano"
         self._app_version = str(app_version or "").strip() or "0.0.0"
         self._endpoints = endpoints
-        storage_root = app_local_data_dir(self._app_name) or executable_dir()
+        install_dir = executable_dir()
+        storage_root = app_local_data_dir(self._app_name) or install_dir
         self._updater = SelfUpdater(
             app_name=self._app_name,
             app_version=self._app_version,
@@ -34,7 +35,7 @@ class UpdateCheckService:
             page_url=str(endpoints.page_url or "").strip(),
             setup_url=str(UPDATE_CHECK_SETUP_URL or "").strip(),
             installer_app_id=str(INNO_SETUP_APP_ID or "").strip(),
-            install_dir=executable_dir(),
+            install_dir=install_dir,
             runtime_storage_dir=storage_root,
         )
         Thread(target=self._updater.recover_pending_update, daemon=True).start()
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
 import sys
+from contextlib import ExitStack
+from functools import partial
 from pathlib import Path
 from typing import TYPE_CHECKING, Callable
 
-from PySide6.QtCore import QEvent, QEventLoop, QPoint, QPointF, QRect, QSize, Qt, Signal, QTimer
-from PySide6.QtGui import QColor, QGuiApplication, QIcon, QPainter, QPen, QPixmap
+from PySide6.QtCore import QEvent, QEventLoop, QPoint, QPointF, QRect, QSignalBlocker, QSize, Qt, Signal, QTimer
+from PySide6.QtGui import QColor, QGuiApplication, QIcon, QPainter, QPen, QPixmap, QStandardItem, QStandardItemModel
 from PySide6.QtWidgets import (
     QApplication,
     QAbstractItemView,
@@ -40,7 +42,7 @@ from openpiano.core.config import (
     UI_SCALE_STEP,
 )
 from openpiano.core.keymap import current_layout_demo_rows, qwerty_demo_rows
-from openpiano.core.object_tree import is_descendant_of
+from openpiano.core.object_tree import has_ancestor_in, is_descendant_of
 from openpiano.core.theme import ThemePalette
 from openpiano.ui.combo_options import bank_options, instrument_options, midi_input_options, preset_options
 from openpiano.ui.modal_utils import (
@@ -55,6 +57,7 @@ from openpiano.ui.panel_sections import (
     configure_controls_row,
     configure_settings_row,
     create_section_card,
+    create_setting_label,
 )
 from openpiano.ui.piano_widget import PianoWidget
 from openpiano.ui.spotlight_overlay import SpotlightOverlay
@@ -76,12 +79,65 @@ ANIMATION_SPEED_LABELS = {
     "slow": "Slow",
     "very_slow": "Very Slow",
 }
+ANIMATION_SPEED_ITEMS = tuple(ANIMATION_SPEED_LABELS.items())
 PIANO_STYLE_LABELS = {
     "premium": "Premium",
     "classic": "Classic",
 }
 
 FOOTER_ICON_SIZE = 19
+_QSS_CACHE_LIMIT = 8
+_DWM_DARK_MODE_ATTRIBUTES = (20, 19)  # DWMWA_USE_IMMERSIVE_DARK_MODE (newer, older)
+_dwm_dark_mode_attribute: int | None = None
+
+_CURSOR_REFRESH_EVENTS = frozenset(
+    {
+        QEvent.EnabledChange,
+        QEvent.Show,
+        QEvent.Hide,
+        QEvent.Enter,
+        QEvent.HoverEnter,
+        QEvent.StyleChange,
+        QEvent.Polish,
+    }
+)
+_TUTORIAL_BLOCKED_EVENTS = frozenset(
+    {
+        QEvent.MouseButtonPress,
+        QEvent.MouseButtonRelease,
+        QEvent.MouseButtonDblClick,
+        QEvent.MouseMove,
+        QEvent.Wheel,
+        QEvent.KeyPress,
+        QEvent.KeyRelease,
+        QEvent.Shortcut,
+        QEvent.ShortcutOverride,
+        QEvent.ContextMenu,
+    }
+)
+_KEYBIND_BLOCKED_MOUSE_EVENTS = frozenset(
+    {
+        QEvent.MouseButtonPress,
+        QEvent.MouseButtonRelease,
+        QEvent.MouseButtonDblClick,
+        QEvent.MouseMove,
+        QEvent.ContextMenu,
+    }
+)
+_FILTERED_EVENTS = _CURSOR_REFRESH_EVENTS | _TUTORIAL_BLOCKED_EVENTS | _KEYBIND_BLOCKED_MOUSE_EVENTS
+
+_INTERACTIVE_CONTROL_TYPES = (QPushButton, QComboBox, QSlider, QCheckBox, QAbstractItemView)
+_INTERACTIVE_TYPE_CACHE: dict[type, bool] = {}
+_WINDOW_ICON_CACHE: dict[str, QIcon] = {}
+
+
+def _window_icon(icon_path: Path) -> QIcon:
+    key = str(icon_path)
+    icon = _WINDOW_ICON_CACHE.get(key)
+    if icon is None:
+        icon = QIcon(key)
+        _WINDOW_ICON_CACHE[key] = icon
+    return icon
 
 
 class MainWindow(QMainWindow):
@@ -132,6 +188,7 @@ class MainWindow(QMainWindow):
         super().__init__()
         self.theme = theme
         self._ui_scale = 1.0
+        self._sp_cache: dict[int, int] = {}
         self._applied_ui_scale = 1.0
         self._piano_style = DEFAULT_PIANO_STYLE
         self._settings_visible = False
@@ -142,14 +199,20 @@ class MainWindow(QMainWindow):
         self._tutorial_mode = False
         self._recording_active = False
         self._recording_has_take = False
+        self._recording_elapsed_seconds = 0
         self._recording_save_busy = False
         self._keybind_edit_active = False
         self._window_pinned = False
         self._ui_scale_steps = int(round((UI_SCALE_MAX - UI_SCALE_MIN) / UI_SCALE_STEP))
         self._ui_scale_commit_timer = QTimer(self)
         self._ui_scale_commit_timer.setSingleShot(True)
-        self._ui_scale_commit_timer.setInterval(120)
+        self._ui_scale_commit_timer.setInterval(200)
         self._ui_scale_commit_timer.timeout.connect(self._commit_ui_scale_if_changed)
+        self._pending_sound_emits: dict[str, float | int] = {}
+        self._sound_emit_timer = QTimer(self)
+        self._sound_emit_timer.setSingleShot(True)
+        self._sound_emit_timer.setInterval(16)
+        self._sound_emit_timer.timeout.connect(self._flush_sound_emits)
         self._layout_refresh_timer = QTimer(self)
         self._layout_refresh_timer.setSingleShot(True)
         self._layout_refresh_timer.setInterval(0)
@@ -158,8 +221,21 @@ class MainWindow(QMainWindow):
         self._checkbox_styles: list[SquareCheckBoxStyle] = []
         self._wheel_allowed_widgets: tuple[QWidget, ...] = ()
         self._wheel_allowed_widget_ids: set[int] = set()
+        self._all_buttons: tuple[QPushButton, ...] = ()
+        self._all_combos: tuple[QComboBox, ...] = ()
+        self._chevron_combos: tuple[ChevronComboBox, ...] = ()
+        self._combo_options: dict[QComboBox, tuple[tuple[str, object], ...]] = {}
+        self._all_checkboxes: tuple[QCheckBox, ...] = ()
+        self._all_sliders: tuple[QSlider, ...] = ()
+        self._style_update_widgets: list[QWidget] = []
+        self._style_refresh_pending = False
+        self._all_notes_off_sync_pending = False
+        self._last_slider_style_key: tuple[int, int, str, str, str] | None = None
+        self._layout_metrics_scale: float | None = None
+        self._last_checkbox_style_key: tuple[int, int, str, str, str] | None = None
         self._global_event_filter_installed = False
         self._last_stylesheet = ""
+        self._qss_cache: dict[tuple[ThemePalette, float], str] = {}
         self._update_progress_dialog: QProgressDialog | None = None
         self._key_color_values: dict[str, str] = {
             "white_key": "",
@@ -172,17 +248,24 @@ class MainWindow(QMainWindow):
         self._icon_path = icon_path
         if hasattr(Qt, "MSWindowsFixedSizeDialogHint"):
             self.setWindowFlag(Qt.MSWindowsFixedSizeDialogHint, True)
-        if icon_path is not None and icon_path.exists():
-            self.setWindowIcon(QIcon(str(icon_path)))
+        if icon_path is not None:
+            icon = _window_icon(icon_path)
+            if not icon.isNull():
+                self.setWindowIcon(icon)
 
         self._build_ui()
+        self._collect_interactive_widgets()
         self._set_interaction_cursors()
-        self._install_wheel_guards()
+        QTimer.singleShot(0, self._install_wheel_guards)
         self._apply_style()
         self.refresh_fixed_size()
 
     def _sp(self, value: int) -> int:
-        return max(1, int(round(value * self._ui_scale)))
+        scaled = self._sp_cache.get(value)
+        if scaled is None:
+            scaled = max(1, int(round(value * self._ui_scale)))
+            self._sp_cache[value] = scaled
+        return scaled
 
     def _build_ui(self) -> None:
         root = QWidget(self)
@@ -198,15 +281,12 @@ class MainWindow(QMainWindow):
         self.stats_bar = StatsBar(self.theme, root)
         outer.addWidget(self.stats_bar)
 
-        self.controls_scroll = QScrollArea(root)
-        self.controls_scroll.setObjectName("controlsScroll")
-        self.controls_scroll.setWidgetResizable(True)
-        self.controls_scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        self.controls_scroll.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        self.controls_scroll.setFrameShape(QFrame.NoFrame)
-        self.controls_scroll.setVisible(False)
-        self.controls_scroll.setFixedHeight(90)
-        outer.addWidget(self.controls_scroll)
+        self.controls_container = QFrame(root)
+        self.controls_container.setObjectName("controlsContainer")
+        self.controls_container.setFrameShape(QFrame.NoFrame)
+        self.controls_container.setVisible(False)
+        self.controls_container.setFixedHeight(90)
+        outer.addWidget(self.controls_container)
 
         self._build_controls_panel()
 
@@ -228,7 +308,6 @@ class MainWindow(QMainWindow):
 
         self._build_settings_panel()
         self._build_footer(outer)
-        self._build_tutorial_overlay(root)
         self._build_keybind_spotlight_overlay(root)
 
         self.recording_indicator = QFrame(root)
@@ -302,14 +381,21 @@ class MainWindow(QMainWindow):
             value_text="0%",
             on_value_changed=self._on_sustain_fade_changed,
         )
+        for slider in (
+            self.volume_slider,
+            self.velocity_slider,
+            self.transpose_slider,
+            self.sustain_slider,
+            self.sustain_fade_slider,
+        ):
+            slider.sliderReleased.connect(self._flush_sound_emits)
 
         self.keyboard_card, keyboard_layout = self._create_section_card("Keyboard", self.settings_body)
         layout.addWidget(self.keyboard_card)
 
         mode_row = QHBoxLayout()
         self._configure_settings_row(mode_row)
-        mode_label = QLabel("Mode", self.keyboard_card)
-        mode_label.setObjectName("settingLabel")
+        mode_label = create_setting_label("Mode", self.keyboard_card)
         mode_holder = QFrame(self.keyboard_card)
         mode_holder.setObjectName("modeHolder")
         mode_holder_layout = QHBoxLayout(mode_holder)
@@ -319,12 +405,13 @@ class MainWindow(QMainWindow):
         self.mode_group.setExclusive(True)
         self.mode_61_btn = QPushButton("61 Keys", mode_holder)
         self.mode_88_btn = QPushButton("88 Keys", mode_holder)
-        for button, mode in ((self.mode_61_btn, "61"), (self.mode_88_btn, "88")):
+        self._mode_by_button_id: dict[int, str] = {61: "61", 88: "88"}
+        for button, button_id in ((self.mode_61_btn, 61), (self.mode_88_btn, 88)):
             button.setObjectName("modeButton")
             button.setCheckable(True)
             mode_holder_layout.addWidget(button)
-            self.mode_group.addButton(button)
-            button.clicked.connect(lambda checked, m=mode: self._on_mode_clicked(checked, m))
+            self.mode_group.addButton(button, button_id)
+        self.mode_group.idClicked.connect(self._on_mode_id_clicked)
         mode_row.addWidget(mode_label)
         mode_row.addWidget(mode_holder, 1)
         keyboard_layout.addLayout(mode_row)
@@ -367,8 +454,7 @@ class MainWindow(QMainWindow):
         keybind_row = QHBoxLayout(self.keybind_row_widget)
         self._configure_settings_row(keybind_row)
         keybind_row.setContentsMargins(6, self._sp(3), 6, self._sp(1))
-        keybind_label = QLabel("Keybinds", self.keybind_row_widget)
-        keybind_label.setObjectName("settingLabel")
+        keybind_label = create_setting_label("Keybinds", self.keybind_row_widget)
         self.change_keybinds_button = QPushButton("Change Keybinds", self.keybind_row_widget)
         self.change_keybinds_button.setObjectName("actionButton")
         self.change_keybinds_button.clicked.connect(self.changeKeybindsRequested.emit)
@@ -422,8 +508,7 @@ class MainWindow(QMainWindow):
 
         piano_style_row = QHBoxLayout()
         self._configure_settings_row(piano_style_row)
-        piano_style_label = QLabel("Piano Style", self.interface_card)
-        piano_style_label.setObjectName("settingLabel")
+        piano_style_label = create_setting_label("Piano Style", self.interface_card)
         piano_style_holder = QFrame(self.interface_card)
         piano_style_holder.setObjectName("modeHolder")
         piano_style_holder_layout = QHBoxLayout(piano_style_holder)
@@ -432,25 +517,26 @@ class MainWindow(QMainWindow):
         self.piano_style_group = QButtonGroup(self.interface_card)
         self.piano_style_group.setExclusive(True)
         self.piano_style_buttons: dict[str, QPushButton] = {}
-        for style, label in PIANO_STYLE_LABELS.items():
+        self._piano_style_by_button_id: dict[int, str] = {}
+        for button_id, (style, label) in enumerate(PIANO_STYLE_LABELS.items()):
             button = QPushButton(label, piano_style_holder)
             button.setObjectName("modeButton")
             button.setCheckable(True)
             piano_style_holder_layout.addWidget(button)
-            self.piano_style_group.addButton(button)
+            self.piano_style_group.addButton(button, button_id)
             self.piano_style_buttons[style] = button
-            button.clicked.connect(lambda checked, selected_style=style: self._on_piano_style_clicked(checked, selected_style))
+            self._piano_style_by_button_id[button_id] = style
+        self.piano_style_group.idClicked.connect(self._on_piano_style_id_clicked)
         piano_style_row.addWidget(piano_style_label)
         piano_style_row.addWidget(piano_style_holder, 1)
         interface_layout.addLayout(piano_style_row)
 
         anim_row = QHBoxLayout()
         self._configure_settings_row(anim_row)
-        anim_label = QLabel("Key backlight fade", self.interface_card)
-        anim_label.setObjectName("settingLabel")
+        anim_label = create_setting_label("Key backlight fade", self.interface_card)
         self.anim_speed_combo = ChevronComboBox(self.interface_card)
         self.anim_speed_combo.setObjectName("animCombo")
-        for speed, label in ANIMATION_SPEED_LABELS.items():
+        for speed, label in ANIMATION_SPEED_ITEMS:
             self.anim_speed_combo.addItem(label, userData=speed)
         self.anim_speed_combo.currentIndexChanged.connect(self._on_anim_index_changed)
         anim_row.addWidget(anim_label)
@@ -459,24 +545,23 @@ class MainWindow(QMainWindow):
 
         colors_row = QHBoxLayout()
         self._configure_settings_row(colors_row)
-        colors_label = QLabel("Key Colors", self.interface_card)
-        colors_label.setObjectName("settingLabel")
+        colors_label = create_setting_label("Key Colors", self.interface_card)
         colors_row.addWidget(colors_label)
         self.white_key_color_button = QPushButton("White", self.interface_card)
         self.white_key_color_button.setObjectName("colorButton")
-        self.white_key_color_button.clicked.connect(lambda: self._on_key_color_clicked("white_key"))
+        self.white_key_color_button.clicked.connect(partial(self._on_key_color_clicked, "white_key"))
         colors_row.addWidget(self.white_key_color_button)
         self.white_key_pressed_color_button = QPushButton("White Pressed", self.interface_card)
         self.white_key_pressed_color_button.setObjectName("colorButton")
-        self.white_key_pressed_color_button.clicked.connect(lambda: self._on_key_color_clicked("white_key_pressed"))
+        self.white_key_pressed_color_button.clicked.connect(partial(self._on_key_color_clicked, "white_key_pressed"))
         colors_row.addWidget(self.white_key_pressed_color_button)
         self.black_key_color_button = QPushButton("Black", self.interface_card)
         self.black_key_color_button.setObjectName("colorButton")
-        self.black_key_color_button.clicked.connect(lambda: self._on_key_color_clicked("black_key"))
+        self.black_key_color_button.clicked.connect(partial(self._on_key_color_clicked, "black_key"))
         colors_row.addWidget(self.black_key_color_button)
         self.black_key_pressed_color_button = QPushButton("Black Pressed", self.interface_card)
         self.black_key_pressed_color_button.setObjectName("colorButton")
-        self.black_key_pressed_color_button.clicked.connect(lambda: self._on_key_color_clicked("black_key_pressed"))
+        self.black_key_pressed_color_button.clicked.connect(partial(self._on_key_color_clicked, "black_key_pressed"))
         colors_row.addWidget(self.black_key_pressed_color_button)
         self.reset_key_colors_button = QPushButton("Reset Colors", self.interface_card)
         self.reset_key_colors_button.setObjectName("actionButton")
@@ -509,15 +594,11 @@ class MainWindow(QMainWindow):
         self._install_checkbox_styles()
 
     def _build_controls_panel(self) -> None:
-        self.controls_body = QWidget(self.controls_scroll)
-        self.controls_body.setObjectName("controlsBody")
-        self.controls_scroll.setWidget(self.controls_body)
-
-        layout = QVBoxLayout(self.controls_body)
+        layout = QVBoxLayout(self.controls_container)
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(0)
 
-        self.controls_card = QFrame(self.controls_body)
+        self.controls_card = QFrame(self.controls_container)
         self.controls_card.setObjectName("settingsCard")
         controls_layout = QVBoxLayout(self.controls_card)
         controls_layout.setContentsMargins(self._sp(8), self._sp(6), self._sp(8), self._sp(6))
@@ -533,26 +614,22 @@ class MainWindow(QMainWindow):
         grid.setColumnStretch(5, 2)
         self.controls_grid = grid
 
-        instrument_label = QLabel("Instrument", self.controls_card)
-        instrument_label.setObjectName("settingLabel")
+        instrument_label = create_setting_label("Instrument", self.controls_card)
         self.instrument_combo = ChevronComboBox(self.controls_card)
         self.instrument_combo.setObjectName("instrumentCombo")
         self.instrument_combo.currentIndexChanged.connect(self._on_instrument_index_changed)
 
-        bank_label = QLabel("Bank", self.controls_card)
-        bank_label.setObjectName("settingLabel")
+        bank_label = create_setting_label("Bank", self.controls_card)
         self.bank_combo = ChevronComboBox(self.controls_card)
         self.bank_combo.setObjectName("bankCombo")
         self.bank_combo.currentIndexChanged.connect(self._on_bank_index_changed)
 
-        preset_label = QLabel("Preset", self.controls_card)
-        preset_label.setObjectName("settingLabel")
+        preset_label = create_setting_label("Preset", self.controls_card)
         self.preset_combo = ChevronComboBox(self.controls_card)
         self.preset_combo.setObjectName("presetCombo")
         self.preset_combo.currentIndexChanged.connect(self._on_preset_index_changed)
 
-        midi_label = QLabel("MIDI In", self.controls_card)
-        midi_label.setObjectName("settingLabel")
+        midi_label = create_setting_label("MIDI In", self.controls_card)
         self.midi_input_combo = ChevronComboBox(self.controls_card)
         self.midi_input_combo.setObjectName("midiInputCombo")
         self.midi_input_combo.currentIndexChanged.connect(self._on_midi_input_index_changed)
@@ -631,13 +708,15 @@ class MainWindow(QMainWindow):
         configure_controls_row(row, self._sp)
 
     def _refresh_scaled_layout_metrics(self) -> None:
-        controls_outer = self.controls_body.layout()
+        sp = self._sp
+        sp1, sp4, sp6, sp8 = sp(1), sp(4), sp(6), sp(8)
+        controls_outer = self.controls_container.layout()
         if isinstance(controls_outer, QVBoxLayout):
-            controls_outer.setSpacing(self._sp(8))
+            controls_outer.setSpacing(sp8)
 
         settings_outer = self.settings_body.layout()
         if isinstance(settings_outer, QVBoxLayout):
-            settings_outer.setSpacing(self._sp(8))
+            settings_outer.setSpacing(sp8)
 
         for card, use_controls_row in (
             (self.sound_card, False),
@@ -649,14 +728,14 @@ class MainWindow(QMainWindow):
             if not isinstance(card_layout, QVBoxLayout):
                 continue
             if use_controls_row:
-                card_layout.setContentsMargins(self._sp(6), self._sp(4), self._sp(6), self._sp(4))
-                card_layout.setSpacing(self._sp(4))
+                card_layout.setContentsMargins(sp6, sp4, sp6, sp4)
+                card_layout.setSpacing(sp4)
             else:
-                card_layout.setContentsMargins(self._sp(8), self._sp(7), self._sp(8), self._sp(7))
+                card_layout.setContentsMargins(sp8, sp(7), sp8, sp(7))
                 if card is self.keyboard_card:
-                    card_layout.setSpacing(self._sp(4))
+                    card_layout.setSpacing(sp4)
                 else:
-                    card_layout.setSpacing(self._sp(8))
+                    card_layout.setSpacing(sp8)
             for idx in range(card_layout.count()):
                 item = card_layout.itemAt(idx)
                 row = item.layout()
@@ -668,27 +747,27 @@ class MainWindow(QMainWindow):
                     self._configure_settings_row(row)
 
         if hasattr(self, "controls_grid"):
-            self.controls_grid.setContentsMargins(self._sp(4), self._sp(1), self._sp(4), self._sp(1))
-            self.controls_grid.setHorizontalSpacing(self._sp(6))
-            self.controls_grid.setVerticalSpacing(self._sp(6))
+            self.controls_grid.setContentsMargins(sp4, sp1, sp4, sp1)
+            self.controls_grid.setHorizontalSpacing(sp6)
+            self.controls_grid.setVerticalSpacing(sp6)
 
-        label_width = self._sp(84)
+        label_width = sp(84)
         for label in getattr(self, "_controls_labels", []):
             label.setMinimumWidth(label_width)
             label.setMaximumWidth(label_width)
 
-        self.instrument_combo.setMinimumWidth(self._sp(200))
-        self.midi_input_combo.setMinimumWidth(self._sp(200))
-        self.bank_combo.setMinimumWidth(self._sp(80))
-        self.preset_combo.setMinimumWidth(self._sp(80))
+        self.instrument_combo.setMinimumWidth(sp(200))
+        self.midi_input_combo.setMinimumWidth(sp(200))
+        self.bank_combo.setMinimumWidth(sp(80))
+        self.preset_combo.setMinimumWidth(sp(80))
         all_notes_target_width = label_width + self.controls_grid.horizontalSpacing() + self.bank_combo.minimumWidth()
         self.all_notes_off_button.setMinimumWidth(all_notes_target_width)
         self.all_notes_off_button.setMaximumWidth(all_notes_target_width)
-        self.recording_toggle_button.setMinimumWidth(self._sp(108))
-        self.recording_timer_label.setMinimumWidth(self._sp(50))
-        self.recording_timer_label.setMaximumWidth(self._sp(58))
-        self.save_recording_button.setMinimumWidth(self._sp(108))
-        controls_row_height = self._sp(32)
+        self.recording_toggle_button.setMinimumWidth(sp(108))
+        self.recording_timer_label.setMinimumWidth(sp(50))
+        self.recording_timer_label.setMaximumWidth(sp(58))
+        self.save_recording_button.setMinimumWidth(sp(108))
+        controls_row_height = sp(32)
         self.all_notes_off_button.setMinimumHeight(controls_row_height)
         self.all_notes_off_button.setMaximumHeight(controls_row_height)
         self.recording_toggle_button.setMinimumHeight(controls_row_height)
@@ -699,15 +778,15 @@ class MainWindow(QMainWindow):
         self.save_recording_button.setMaximumHeight(controls_row_height)
         footer_layout = getattr(self, "_footer_layout", None)
         if isinstance(footer_layout, QHBoxLayout):
-            footer_layout.setContentsMargins(self._sp(6), 0, self._sp(6), 0)
-            footer_layout.setSpacing(self._sp(8))
+            footer_layout.setContentsMargins(sp6, 0, sp6, 0)
+            footer_layout.setSpacing(sp8)
         if hasattr(self, "theme_toggle_button"):
-            icon_px = max(18, self._sp(FOOTER_ICON_SIZE - 2))
+            icon_px = max(18, sp(FOOTER_ICON_SIZE - 2))
             self.theme_toggle_button.setIconSize(QSize(icon_px, icon_px))
             if hasattr(self, "pin_toggle_button"):
                 self.pin_toggle_button.setIconSize(QSize(icon_px, icon_px))
                 self._refresh_pin_toggle_icon()
-        QTimer.singleShot(0, self._sync_all_notes_off_width)
+        self._schedule_all_notes_off_sync()
 
     def _create_section_card(self, title: str, parent: QWidget) -> tuple[QFrame, QVBoxLayout]:
         return create_section_card(title, parent)
@@ -724,8 +803,9 @@ class MainWindow(QMainWindow):
 
     def _install_slider_styles(self) -> None:
         self._slider_styles.clear()
-        handle_size = max(12, min(36, self._sp(18)))
-        groove_height = max(4, min(14, self._sp(6)))
+        sp = self._sp
+        handle_size = max(12, min(36, sp(18)))
+        groove_height = max(4, min(14, sp(6)))
         for slider in self._setting_sliders():
             style = RoundHandleSliderStyle(
                 handle_color=self.theme.text_primary,
@@ -741,6 +821,10 @@ class MainWindow(QMainWindow):
     def _refresh_slider_style_colors(self) -> None:
         handle_size = max(12, min(36, self._sp(18)))
         groove_height = max(4, min(14, self._sp(6)))
+        style_key = (handle_size, groove_height, self.theme.text_primary, self.theme.border, self.theme.accent)
+        if style_key == self._last_slider_style_key:
+            return
+        self._last_slider_style_key = style_key
         for style in self._slider_styles:
             style.set_colors(
                 handle_color=self.theme.text_primary,
@@ -749,14 +833,14 @@ class MainWindow(QMainWindow):
                 fill_color=self.theme.accent,
             )
             style.set_metrics(handle_size=handle_size, groove_height=groove_height)
-        for slider in self._setting_sliders():
-            slider.update()
+        self._queue_style_updates(self._setting_sliders())
 
     def _install_checkbox_styles(self) -> None:
         self._checkbox_styles.clear()
         size = max(18, min(40, self._sp(24)))
         radius = max(3, int(round(size / 5)))
-        for checkbox in self.findChildren(QCheckBox):
+        self._all_checkboxes = tuple(self.findChildren(QCheckBox))
+        for checkbox in self._all_checkboxes:
             style = SquareCheckBoxStyle(
                 border_color=self.theme.border,
                 fill_color=self.theme.accent,
@@ -770,6 +854,10 @@ class MainWindow(QMainWindow):
     def _refresh_checkbox_style_colors(self) -> None:
         size = max(18, min(40, self._sp(24)))
         radius = max(3, int(round(size / 5)))
+        style_key = (size, radius, self.theme.border, self.theme.accent, self.theme.text_primary)
+        if style_key == self._last_checkbox_style_key:
+            return
+        self._last_checkbox_style_key = style_key
         for style in self._checkbox_styles:
             style.set_colors(
                 border_color=self.theme.border,
@@ -777,8 +865,21 @@ class MainWindow(QMainWindow):
                 check_color=self.theme.text_primary,
             )
             style.set_metrics(size=size, radius=radius)
-        for checkbox in self.findChildren(QCheckBox):
-            checkbox.update()
+        self._queue_style_updates(self._all_checkboxes)
+
+    def _queue_style_updates(self, widgets: tuple[QWidget, ...]) -> None:
+        self._style_update_widgets.extend(widgets)
+        if self._style_refresh_pending:
+            return
+        self._style_refresh_pending = True
+        QTimer.singleShot(0, self._flush_style_updates)
+
+    def _flush_style_updates(self) -> None:
+        self._style_refresh_pending = False
+        widgets = dict.fromkeys(self._style_update_widgets)
+        self._style_update_widgets.clear()
+        for widget in widgets:
+            widget.update()
 
     def _build_footer(self, outer: QVBoxLayout) -> None:
         self.footer_bar = QFrame(self.centralWidget())
@@ -802,52 +903,31 @@ class MainWindow(QMainWindow):
         self.pin_toggle_button.setIconSize(QSize(self._sp(FOOTER_ICON_SIZE), self._sp(FOOTER_ICON_SIZE)))
         self.pin_toggle_button.toggled.connect(self._on_pin_toggled)
 
-        self.settings_toggle_button = QPushButton("Show Settings", self.footer_bar)
-        self.settings_toggle_button.setObjectName("footerLink")
-        self.settings_toggle_button.clicked.connect(self._on_settings_toggle_clicked)
-
-        self.stats_toggle_button = QPushButton("Hide Stats", self.footer_bar)
-        self.stats_toggle_button.setObjectName("footerLink")
-        self.stats_toggle_button.clicked.connect(self._on_stats_toggle_clicked)
-
-        self.controls_toggle_button = QPushButton("Show Controls", self.footer_bar)
-        self.controls_toggle_button.setObjectName("footerLink")
-        self.controls_toggle_button.clicked.connect(self._on_controls_toggle_clicked)
-
-        self.tutorial_button = QPushButton("Tutorial", self.footer_bar)
-        self.tutorial_button.setObjectName("footerLink")
-        self.tutorial_button.clicked.connect(self.tutorialRequested.emit)
-
-        self.website_button = QPushButton("Official website", self.footer_bar)
-        self.website_button.setObjectName("footerLink")
-        self.website_button.clicked.connect(self.websiteRequested.emit)
-
-        for button in (
-            self.settings_toggle_button,
-            self.stats_toggle_button,
-            self.controls_toggle_button,
-            self.tutorial_button,
-            self.website_button,
-        ):
-            button.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
-            button.setFlat(True)
+        row.addWidget(self.theme_toggle_button)
+        row.addWidget(self.pin_toggle_button)
+        self.settings_toggle_button = self._add_footer_link(row, "Show Settings", self._on_settings_toggle_clicked)
+        self.stats_toggle_button = self._add_footer_link(row, "Hide Stats", self._on_stats_toggle_clicked)
+        self.controls_toggle_button = self._add_footer_link(row, "Show Controls", self._on_controls_toggle_clicked)
+        row.addStretch(1)
+        self.website_button = self._add_footer_link(row, "Official website", self.websiteRequested.emit)
+        self.tutorial_button = self._add_footer_link(row, "Tutorial", self.tutorialRequested.emit)
 
         version_label = QLabel(f"v{APP_VERSION}", self.footer_bar)
         version_label.setObjectName("footerVersion")
         version_label.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
-
-        row.addWidget(self.theme_toggle_button)
-        row.addWidget(self.pin_toggle_button)
-        row.addWidget(self.settings_toggle_button)
-        row.addWidget(self.stats_toggle_button)
-        row.addWidget(self.controls_toggle_button)
-        row.addStretch(1)
-        row.addWidget(self.website_button)
-        row.addWidget(self.tutorial_button)
         row.addWidget(version_label)
 
         outer.addWidget(self.footer_bar)
 
+    def _add_footer_link(self, row: QHBoxLayout, label: str, slot: Callable[[], None]) -> QPushButton:
+        button = QPushButton(label, self.footer_bar)
+        button.setObjectName("footerLink")
+        button.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
+        button.setFlat(True)
+        button.clicked.connect(slot)
+        row.addWidget(button)
+        return button
+
     def _build_theme_icon(self, mode: str) -> QIcon:
         if not hasattr(self, "theme_toggle_button"):
             return QIcon()
@@ -943,6 +1023,25 @@ class MainWindow(QMainWindow):
         self._tutorial_overlay.setGeometry(parent.rect())
         self._tutorial_overlay.hide()
 
+    def _ensure_tutorial_overlay(self) -> TutorialOverlay:
+        overlay = getattr(self, "_tutorial_overlay", None)
+        if overlay is None:
+            self._build_tutorial_overlay(self.centralWidget())
+            overlay = self._tutorial_overlay
+            overlay_buttons = tuple(overlay.findChildren(QPushButton))
+            self._all_buttons += overlay_buttons
+            for button in overlay_buttons:
+                self._set_widget_cursor(button)
+                button.setFocusPolicy(Qt.NoFocus)
+        return overlay
+
+    def _collect_interactive_widgets(self) -> None:
+        self._all_buttons = tuple(self.findChildren(QPushButton))
+        self._all_combos = tuple(self.findChildren(QComboBox))
+        self._chevron_combos = tuple(combo for combo in self._all_combos if isinstance(combo, ChevronComboBox))
+        self._all_checkboxes = tuple(self.findChildren(QCheckBox))
+        self._all_sliders = tuple(self.findChildren(QSlider))
+
     def _build_keybind_spotlight_overlay(self, parent: QWidget) -> None:
         self._keybind_overlay = SpotlightOverlay(self.theme, parent)
         self._keybind_overlay.setGeometry(parent.rect())
@@ -950,10 +1049,10 @@ class MainWindow(QMainWindow):
 
     def _set_interaction_cursors(self) -> None:
         self.piano_widget.setFocusPolicy(Qt.StrongFocus)
-        for button in self.findChildren(QPushButton):
+        for button in self._all_buttons:
             self._set_widget_cursor(button)
             button.setFocusPolicy(Qt.NoFocus)
-        for combo in self.findChildren(QComboBox):
+        for combo in self._all_combos:
             self._set_widget_cursor(combo)
             combo.setFocusPolicy(Qt.NoFocus)
             view = combo.view()
@@ -962,19 +1061,21 @@ class MainWindow(QMainWindow):
                 viewport = view.viewport()
                 if viewport is not None:
                     self._set_widget_cursor(viewport)
-        for checkbox in self.findChildren(QCheckBox):
+        for checkbox in self._all_checkboxes:
             self._set_widget_cursor(checkbox)
             checkbox.setFocusPolicy(Qt.NoFocus)
-        for slider in self.findChildren(QSlider):
+        for slider in self._all_sliders:
             self._set_widget_cursor(slider)
             slider.setFocusPolicy(Qt.NoFocus)
 
     @staticmethod
     def _set_widget_cursor(widget: QWidget) -> None:
         # Keep cursor policy stable across hide/show and parent visibility changes.
+        has_cursor = widget.testAttribute(Qt.WA_SetCursor)
         if widget.isEnabled():
-            widget.setCursor(Qt.PointingHandCursor)
-        else:
+            if not has_cursor or widget.cursor().shape() != Qt.PointingHandCursor:
+                widget.setCursor(Qt.PointingHandCursor)
+        elif has_cursor:
             widget.unsetCursor()
 
     def _install_wheel_guards(self) -> None:
@@ -985,7 +1086,7 @@ class MainWindow(QMainWindow):
                 self._global_event_filter_installed = True
         wheel_targets: list[QWidget] = []
         wheel_target_ids: set[int] = set()
-        for combo in self.findChildren(QComboBox):
+        for combo in self._all_combos:
             view = combo.view()
             if view is not None:
                 wheel_targets.append(view)
@@ -998,12 +1099,7 @@ class MainWindow(QMainWindow):
         self._wheel_allowed_widget_ids = wheel_target_ids
 
     def _wheel_allowed(self, watched: object) -> bool:
-        if id(watched) in self._wheel_allowed_widget_ids:
-            return True
-        for target in self._wheel_allowed_widgets:
-            if is_descendant_of(watched, target):
-                return True
-        return False
+        return has_ancestor_in(watched, self._wheel_allowed_widget_ids)
 
     def _is_settings_descendant(self, watched: object) -> bool:
         return is_descendant_of(watched, self.settings_scroll)
@@ -1036,7 +1132,12 @@ class MainWindow(QMainWindow):
 
     @staticmethod
     def _is_interactive_control(watched: object) -> bool:
-        return isinstance(watched, (QPushButton, QComboBox, QSlider, QCheckBox, QAbstractItemView))
+        watched_type = type(watched)
+        interactive = _INTERACTIVE_TYPE_CACHE.get(watched_type)
+        if interactive is None:
+            interactive = issubclass(watched_type, _INTERACTIVE_CONTROL_TYPES)
+            _INTERACTIVE_TYPE_CACHE[watched_type] = interactive
+        return interactive
 
     @staticmethod
     def _scroll_area_by_wheel(scroll_area: QScrollArea, delta_y: int) -> None:
@@ -1053,57 +1154,33 @@ class MainWindow(QMainWindow):
 
     def eventFilter(self, watched, event):                          
         event_type = event.type()
+        if event_type not in _FILTERED_EVENTS:
+            return super().eventFilter(watched, event)
         in_window_scope = watched is self or is_descendant_of(watched, self)
         popup_target = self._wheel_allowed(watched)
         wheel_popup_target = event_type == QEvent.Wheel and popup_target
         if not in_window_scope and not popup_target:
             return super().eventFilter(watched, event)
 
-        if event_type in {
-            QEvent.EnabledChange,
-            QEvent.Show,
-            QEvent.Hide,
-            QEvent.Enter,
-            QEvent.HoverEnter,
-            QEvent.StyleChange,
-            QEvent.Polish,
-        }:
+        if event_type in _CURSOR_REFRESH_EVENTS:
             if (
                 isinstance(watched, QWidget)
-                and (self._is_interactive_control(watched) or self._wheel_allowed(watched))
+                and (self._is_interactive_control(watched) or popup_target)
             ):
                 self._set_widget_cursor(watched)
 
-        if self._tutorial_mode and not self._is_tutorial_descendant(watched):
-            if event_type in {
-                QEvent.MouseButtonPress,
-                QEvent.MouseButtonRelease,
-                QEvent.MouseButtonDblClick,
-                QEvent.MouseMove,
-                QEvent.Wheel,
-                QEvent.KeyPress,
-                QEvent.KeyRelease,
-                QEvent.Shortcut,
-                QEvent.ShortcutOverride,
-                QEvent.ContextMenu,
-            }:
+        if self._tutorial_mode and event_type in _TUTORIAL_BLOCKED_EVENTS:
+            if not self._is_tutorial_descendant(watched):
                 event.accept()
                 return True
 
         if self._keybind_edit_active:
-            blocked_mouse_events = {
-                QEvent.MouseButtonPress,
-                QEvent.MouseButtonRelease,
-                QEvent.MouseButtonDblClick,
-                QEvent.MouseMove,
-                QEvent.ContextMenu,
-            }
             if event_type == QEvent.Wheel:
                 self.keybindEditActionBlocked.emit()
                 event.accept()
                 return True
             target = self.event_widget_at_pointer(watched, event)
-            if event_type in blocked_mouse_events and not self.is_keybind_edit_allowed_target(target):
+            if event_type in _KEYBIND_BLOCKED_MOUSE_EVENTS and not self.is_keybind_edit_allowed_target(target):
                 if event_type in {QEvent.MouseButtonPress, QEvent.ContextMenu}:
                     self.keybindEditActionBlocked.emit()
                 event.accept()
@@ -1136,6 +1213,16 @@ class MainWindow(QMainWindow):
             dot.raise_()
 
 
+    def _schedule_all_notes_off_sync(self) -> None:
+        if self._all_notes_off_sync_pending:
+            return
+        self._all_notes_off_sync_pending = True
+        QTimer.singleShot(0, self._flush_all_notes_off_sync)
+
+    def _flush_all_notes_off_sync(self) -> None:
+        self._all_notes_off_sync_pending = False
+        self._sync_all_notes_off_width()
+
     def _sync_all_notes_off_width(self) -> None:
         if not hasattr(self, "controls_actions"):
             return
@@ -1150,127 +1237,160 @@ class MainWindow(QMainWindow):
         self.all_notes_off_button.setMaximumWidth(target_width)
 
     def _apply_style(self) -> None:
-        label_font = self._sp(11)
-        value_font = self._sp(11)
-        stats_value_font = self._sp(12)
-        card_title_font = self._sp(12)
-        button_font = self._sp(10)
-        footer_font = max(8, int(round(10.2 * self._ui_scale)))
-        combo_height = self._sp(24)
-        slider_min_h = max(16, self._sp(24))
-        self.settings_scroll.setFixedHeight(self._sp(236))
-        self.controls_scroll.setFixedHeight(self._sp(90))
-        self.panel_divider.setFixedHeight(max(1, self._sp(1)))
-        dot_size = max(12, self._sp(14))
-        dot_radius = dot_size // 2
+        sp = self._sp
+        self.settings_scroll.setFixedHeight(sp(236))
+        self.controls_container.setFixedHeight(sp(90))
+        self.panel_divider.setFixedHeight(max(1, sp(1)))
+        dot_size = max(12, sp(14))
         self.recording_indicator.setFixedSize(dot_size, dot_size)
-        self._recording_indicator_effect.setBlurRadius(max(16, self._sp(22)))
+        self._recording_indicator_effect.setBlurRadius(max(16, sp(22)))
         glow_color = QColor(self.theme.accent_hover)
         glow_color.setAlpha(210)
         self._recording_indicator_effect.setColor(glow_color)
-        self._refresh_scaled_layout_metrics()
-        style_sheet = f"""
+        if self._ui_scale != self._layout_metrics_scale:
+            self._layout_metrics_scale = self._ui_scale
+            self._refresh_scaled_layout_metrics()
+        else:
+            self._refresh_pin_toggle_icon()
+        qss_key = (self.theme, self._ui_scale)
+        style_sheet = self._qss_cache.get(qss_key)
+        if style_sheet is None:
+            style_sheet = self._build_style_sheet()
+            if len(self._qss_cache) >= _QSS_CACHE_LIMIT:
+                self._qss_cache.pop(next(iter(self._qss_cache)))
+            self._qss_cache[qss_key] = style_sheet
+        if style_sheet != self._last_stylesheet:
+            self._last_stylesheet = style_sheet
+            self.setStyleSheet(style_sheet)
+        self._refresh_key_color_buttons()
+        self._refresh_slider_style_colors()
+        self._refresh_checkbox_style_colors()
+        hover = QColor(self.theme.border)
+        hover = hover.lighter(128) if self._theme_mode == "dark" else hover.darker(108)
+        for combo in self._chevron_combos:
+            combo.set_arrow_colors(self.theme.text_secondary, self.theme.text_primary)
+            combo.set_popup_colors(
+                accent=self.theme.accent,
+                text=self.theme.text_primary,
+                panel=self.theme.panel_bg,
+                hover=hover.name(),
+            )
+        self.set_theme_mode(self._theme_mode)
+        self._position_recording_indicator()
+        overlay = getattr(self, "_tutorial_overlay", None)
+        if overlay is not None:
+            overlay.set_theme(self.theme)
+        keybind_overlay = getattr(self, "_keybind_overlay", None)
+        if keybind_overlay is not None:
+            keybind_overlay.set_theme(self.theme)
+
+    def _build_style_sheet(self) -> str:
+        sp = self._sp
+        theme = self.theme
+        label_font = sp(11)
+        value_font = sp(11)
+        stats_value_font = sp(12)
+        card_title_font = sp(12)
+        button_font = sp(10)
+        footer_font = max(8, int(round(10.2 * self._ui_scale)))
+        combo_height = sp(24)
+        slider_min_h = max(16, sp(24))
+        dot_radius = max(12, sp(14)) // 2
+        return f"""
             QMainWindow {{
-                background-color: {self.theme.app_bg};
+                background-color: {theme.app_bg};
             }}
             #statsBar {{
-                background: {self.theme.panel_bg};
-                border: 1px solid {self.theme.border};
+                background: {theme.panel_bg};
+                border: 1px solid {theme.border};
                 border-radius: 8px;
             }}
             #statsSlot {{
                 background: transparent;
                 border: none;
-                min-width: {self._sp(112)}px;
+                min-width: {sp(112)}px;
             }}
             #statsTitle {{
-                color: {self.theme.text_secondary};
-                font: 600 {self._sp(8)}pt "Segoe UI";
+                color: {theme.text_secondary};
+                font: 600 {sp(8)}pt "Segoe UI";
             }}
             #statsValue {{
-                color: {self.theme.text_primary};
+                color: {theme.text_primary};
                 font: 700 {stats_value_font}pt "Consolas";
             }}
             #settingsScroll {{
-                background: {self.theme.app_bg};
+                background: {theme.app_bg};
                 border: none;
             }}
-            #controlsScroll {{
-                background: {self.theme.app_bg};
+            #controlsContainer {{
+                background: {theme.app_bg};
                 border: none;
             }}
             QScrollArea#settingsScroll QWidget#qt_scrollarea_viewport {{
-                background: {self.theme.app_bg};
-                border: none;
-            }}
-            QScrollArea#controlsScroll QWidget#qt_scrollarea_viewport {{
-                background: {self.theme.app_bg};
+                background: {theme.app_bg};
                 border: none;
             }}
             #settingsBody {{
-                background: {self.theme.app_bg};
-            }}
-            #controlsBody {{
-                background: {self.theme.app_bg};
+                background: {theme.app_bg};
             }}
             #settingsCard {{
-                background: {self.theme.panel_bg};
-                border: 1px solid {self.theme.border};
+                background: {theme.panel_bg};
+                border: 1px solid {theme.border};
                 border-radius: 8px;
             }}
             #settingsCardTitle {{
-                color: {self.theme.text_primary};
+                color: {theme.text_primary};
                 font: 700 {card_title_font}pt "Segoe UI";
             }}
             #settingLabel {{
-                color: {self.theme.text_secondary};
+                color: {theme.text_secondary};
                 font: 600 {label_font}pt "Segoe UI";
-                min-width: {self._sp(80)}px;
+                min-width: {sp(80)}px;
             }}
             #settingValue {{
-                color: {self.theme.text_primary};
+                color: {theme.text_primary};
                 font: 600 {value_font}pt "Segoe UI";
-                min-width: {self._sp(54)}px;
+                min-width: {sp(54)}px;
             }}
             #settingHint {{
-                color: {self.theme.text_secondary};
-                font: 500 {self._sp(9)}pt "Segoe UI";
+                color: {theme.text_secondary};
+                font: 500 {sp(9)}pt "Segoe UI";
             }}
             #settingCheckbox {{
-                color: {self.theme.text_primary};
-                font: 600 {self._sp(10)}pt "Segoe UI";
+                color: {theme.text_primary};
+                font: 600 {sp(10)}pt "Segoe UI";
                 spacing: 6px;
-                padding: {self._sp(2)}px 0 {self._sp(2)}px 0;
+                padding: {sp(2)}px 0 {sp(2)}px 0;
                 margin: 0;
             }}
             #modeHolder {{
-                background: {self.theme.app_bg};
-                border: 1px solid {self.theme.border};
+                background: {theme.app_bg};
+                border: 1px solid {theme.border};
                 border-radius: 8px;
             }}
             #modeButton {{
                 background: transparent;
-                color: {self.theme.text_secondary};
+                color: {theme.text_secondary};
                 border: none;
                 border-radius: 6px;
-                padding: {self._sp(4)}px {self._sp(11)}px;
-                font: 600 {self._sp(11)}pt "Segoe UI";
+                padding: {sp(4)}px {sp(11)}px;
+                font: 600 {sp(11)}pt "Segoe UI";
             }}
             #modeButton:hover {{
-                color: {self.theme.text_primary};
-                background: {self.theme.panel_bg};
+                color: {theme.text_primary};
+                background: {theme.panel_bg};
             }}
             #modeButton:checked {{
-                color: {self.theme.text_primary};
-                background: {self.theme.accent};
+                color: {theme.text_primary};
+                background: {theme.accent};
             }}
             #instrumentCombo, #bankCombo, #presetCombo, #animCombo, #midiInputCombo {{
-                background: {self.theme.app_bg};
-                color: {self.theme.text_primary};
-                border: 1px solid {self.theme.border};
+                background: {theme.app_bg};
+                color: {theme.text_primary};
+                border: 1px solid {theme.border};
                 border-radius: 6px;
-                padding: {self._sp(2)}px {self._sp(7)}px;
-                padding-right: {self._sp(32)}px;
+                padding: {sp(2)}px {sp(7)}px;
+                padding-right: {sp(32)}px;
                 font: 600 {label_font}pt "Segoe UI";
                 min-height: {combo_height}px;
             }}
@@ -1281,12 +1401,12 @@ class MainWindow(QMainWindow):
             #midiInputCombo::drop-down {{
                 subcontrol-origin: padding;
                 subcontrol-position: top right;
-                width: {self._sp(30)}px;
+                width: {sp(30)}px;
                 border: none;
-                border-left: 1px solid {self.theme.border};
+                border-left: 1px solid {theme.border};
                 border-top-right-radius: 6px;
                 border-bottom-right-radius: 6px;
-                background: {self.theme.panel_bg};
+                background: {theme.panel_bg};
             }}
             #instrumentCombo::down-arrow,
             #bankCombo::down-arrow,
@@ -1306,10 +1426,10 @@ class MainWindow(QMainWindow):
             #presetCombo QAbstractItemView,
             #animCombo QAbstractItemView,
             #midiInputCombo QAbstractItemView {{
-                background: {self.theme.panel_bg};
-                color: {self.theme.text_primary};
-                border: 1px solid {self.theme.border};
-                selection-background-color: {self.theme.accent};
+                background: {theme.panel_bg};
+                color: {theme.text_primary};
+                border: 1px solid {theme.border};
+                selection-background-color: {theme.accent};
                 font: 600 {label_font}pt "Segoe UI";
             }}
             #volumeSlider,
@@ -1322,55 +1442,55 @@ class MainWindow(QMainWindow):
                 background: transparent;
             }}
             #colorButton, #actionButton, #resetButton {{
-                background: {self.theme.panel_bg};
-                color: {self.theme.text_primary};
-                border: 1px solid {self.theme.border};
+                background: {theme.panel_bg};
+                color: {theme.text_primary};
+                border: 1px solid {theme.border};
                 border-radius: 6px;
-                padding: {self._sp(4)}px {self._sp(8)}px;
+                padding: {sp(4)}px {sp(8)}px;
                 font: 600 {button_font}pt "Segoe UI";
             }}
             #colorButton {{
-                min-height: {self._sp(26)}px;
-                padding: {self._sp(3)}px {self._sp(8)}px;
-                font: 600 {self._sp(10)}pt "Segoe UI";
+                min-height: {sp(26)}px;
+                padding: {sp(4)}px {sp(10)}px;
+                font: 600 {sp(10)}pt "Segoe UI";
             }}
             #resetButton {{
-                min-height: {self._sp(32)}px;
-                padding: {self._sp(5)}px {self._sp(10)}px;
-                font: 700 {self._sp(11)}pt "Segoe UI";
+                min-height: {sp(32)}px;
+                padding: {sp(5)}px {sp(10)}px;
+                font: 700 {sp(11)}pt "Segoe UI";
             }}
             #recordingTimer {{
-                background: {self.theme.app_bg};
-                color: {self.theme.text_primary};
-                border: 1px solid {self.theme.border};
+                background: {theme.app_bg};
+                color: {theme.text_primary};
+                border: 1px solid {theme.border};
                 border-radius: 6px;
-                padding: {self._sp(4)}px {self._sp(7)}px;
-                font: 700 {self._sp(10)}pt "Consolas";
+                padding: {sp(4)}px {sp(7)}px;
+                font: 700 {sp(10)}pt "Consolas";
             }}
             #colorButton:hover, #actionButton:hover, #resetButton:hover {{
-                background: {self.theme.accent};
-                color: {self.theme.text_primary};
+                background: {theme.accent};
+                color: {theme.text_primary};
             }}
             #actionButton:disabled {{
-                color: {self.theme.text_secondary};
-                border-color: {self.theme.border};
-                background: {self.theme.app_bg};
+                color: {theme.text_secondary};
+                border-color: {theme.border};
+                background: {theme.app_bg};
             }}
             #footerBar {{
                 background: transparent;
                 border: none;
             }}
             #footerDivider {{
-                background: {self.theme.border};
+                background: {theme.border};
                 border: none;
             }}
             #panelDivider {{
-                background: {self.theme.border};
+                background: {theme.border};
                 border: none;
             }}
             #footerLink {{
                 background: transparent;
-                color: {self.theme.accent};
+                color: {theme.accent};
                 border: none;
                 padding-top: 1px;
                 padding-right: 2px;
@@ -1380,22 +1500,22 @@ class MainWindow(QMainWindow):
                 text-align: left;
             }}
             #footerLink:hover {{
-                color: {self.theme.text_primary};
+                color: {theme.text_primary};
                 background: transparent;
             }}
             #footerVersion {{
-                color: {self.theme.text_secondary};
+                color: {theme.text_secondary};
                 font: 700 {footer_font}pt "Segoe UI";
                 padding-top: 0px;
             }}
             #footerIcon {{
                 background: transparent;
-                color: {self.theme.text_primary};
+                color: {theme.text_primary};
                 border: none;
-                min-width: {self._sp(FOOTER_ICON_SIZE)}px;
-                min-height: {self._sp(FOOTER_ICON_SIZE)}px;
-                max-width: {self._sp(FOOTER_ICON_SIZE)}px;
-                max-height: {self._sp(FOOTER_ICON_SIZE)}px;
+                min-width: {sp(FOOTER_ICON_SIZE)}px;
+                min-height: {sp(FOOTER_ICON_SIZE)}px;
+                max-width: {sp(FOOTER_ICON_SIZE)}px;
+                max-height: {sp(FOOTER_ICON_SIZE)}px;
                 padding: 0;
                 margin: 0;
             }}
@@ -1403,35 +1523,11 @@ class MainWindow(QMainWindow):
                 background: transparent;
             }}
             #recordingIndicator {{
-                background: {self.theme.accent};
-                border: 1px solid {self.theme.accent_hover};
+                background: {theme.accent};
+                border: 1px solid {theme.accent_hover};
                 border-radius: {dot_radius}px;
             }}
             """
-        if style_sheet != self._last_stylesheet:
-            self._last_stylesheet = style_sheet
-            self.setStyleSheet(style_sheet)
-        self._refresh_key_color_buttons()
-        self._refresh_slider_style_colors()
-        self._refresh_checkbox_style_colors()
-        hover = QColor(self.theme.border)
-        hover = hover.lighter(128) if self._theme_mode == "dark" else hover.darker(108)
-        for combo in self.findChildren(ChevronComboBox):
-            combo.set_arrow_colors(self.theme.text_secondary, self.theme.text_primary)
-            combo.set_popup_colors(
-                accent=self.theme.accent,
-                text=self.theme.text_primary,
-                panel=self.theme.panel_bg,
-                hover=hover.name(),
-            )
-        self.set_theme_mode(self._theme_mode)
-        self._position_recording_indicator()
-        overlay = getattr(self, "_tutorial_overlay", None)
-        if overlay is not None:
-            overlay.set_theme(self.theme)
-        keybind_overlay = getattr(self, "_keybind_overlay", None)
-        if keybind_overlay is not None:
-            keybind_overlay.set_theme(self.theme)
 
     def _schedule_layout_refresh(self) -> None:
         if self._layout_refresh_timer.isActive():
@@ -1440,11 +1536,12 @@ class MainWindow(QMainWindow):
 
     def refresh_fixed_size(self) -> None:
         self.centralWidget().layout().activate()
-        self.adjustSize()
-        target_size = self.sizeHint()
-        self.setFixedSize(target_size)
+        hint = self.sizeHint()
+        if hint != self.size() or self.minimumSize() != hint or self.maximumSize() != hint:
+            self.adjustSize()
+            self.setFixedSize(self.sizeHint())
         self._position_recording_indicator()
-        QTimer.singleShot(0, self._sync_all_notes_off_width)
+        self._schedule_all_notes_off_sync()
         self._sync_tutorial_overlay()
         self._sync_keybind_overlay()
 
@@ -1530,7 +1627,7 @@ class MainWindow(QMainWindow):
     def resizeEvent(self, event) -> None:                          
         super().resizeEvent(event)
         self._position_recording_indicator()
-        QTimer.singleShot(0, self._sync_all_notes_off_width)
+        self._schedule_all_notes_off_sync()
         self._sync_tutorial_overlay()
         self._sync_keybind_overlay()
 
@@ -1538,8 +1635,9 @@ class MainWindow(QMainWindow):
         super().showEvent(event)
         self._apply_windows_title_bar_theme()
 
-    def _on_mode_clicked(self, checked: bool, mode: str) -> None:
-        if checked:
+    def _on_mode_id_clicked(self, button_id: int) -> None:
+        mode = self._mode_by_button_id.get(button_id)
+        if mode is not None and self.mode_group.button(button_id).isChecked():
             self.modeChanged.emit(mode)
 
     def _on_instrument_index_changed(self, index: int) -> None:
@@ -1570,26 +1668,43 @@ class MainWindow(QMainWindow):
         if isinstance(device, str):
             self.midiInputDeviceChanged.emit(device)
 
+    def _queue_sound_emit(self, signal_name: str, value: float | int) -> None:
+        self._pending_sound_emits[signal_name] = value
+        self._sound_emit_timer.start()
+
+    def _cancel_sound_emit(self, signal_name: str) -> None:
+        if self._pending_sound_emits.pop(signal_name, None) is not None and not self._pending_sound_emits:
+            self._sound_emit_timer.stop()
+
+    def _flush_sound_emits(self) -> None:
+        self._sound_emit_timer.stop()
+        pending = self._pending_sound_emits
+        if not pending:
+            return
+        self._pending_sound_emits = {}
+        for signal_name, value in pending.items():
+            getattr(self, signal_name).emit(value)
+
     def _on_volume_value_changed(self, value: int) -> None:
         self.volume_value.setText(f"{value}%")
-        self.volumeChanged.emit(max(0.0, min(1.0, value / 100.0)))
+        self._queue_sound_emit("volumeChanged", max(0.0, min(1.0, value / 100.0)))
 
     def _on_velocity_value_changed(self, value: int) -> None:
         velocity = max(1, min(127, int(value)))
         self.velocity_value.setText(str(velocity))
-        self.velocityChanged.emit(velocity)
+        self._queue_sound_emit("velocityChanged", velocity)
 
     def _on_transpose_value_changed(self, value: int) -> None:
         self.transpose_value.setText(f"{value:+d}")
-        self.transposeChanged.emit(int(value))
+        self._queue_sound_emit("transposeChanged", int(value))
 
     def _on_sustain_percent_changed(self, value: int) -> None:
         self.sustain_value.setText(f"{int(value)}%")
-        self.sustainPercentChanged.emit(int(value))
+        self._queue_sound_emit("sustainPercentChanged", int(value))
 
     def _on_sustain_fade_changed(self, value: int) -> None:
         self.sustain_fade_value.setText(f"{int(value)}%")
-        self.sustainFadeChanged.emit(int(value))
+        self._queue_sound_emit("sustainFadeChanged", int(value))
 
     def _on_ui_scale_value_changed(self, value: int) -> None:
         scale = UI_SCALE_MIN + (int(value) * UI_SCALE_STEP)
@@ -1621,8 +1736,9 @@ class MainWindow(QMainWindow):
         if isinstance(speed, str):
             self.animationSpeedChanged.emit(speed)
 
-    def _on_piano_style_clicked(self, checked: bool, style: str) -> None:
-        if not checked:
+    def _on_piano_style_id_clicked(self, button_id: int) -> None:
+        style = self._piano_style_by_button_id.get(button_id)
+        if style is None or not self.piano_style_group.button(button_id).isChecked():
             return
         self.pianoStyleChanged.emit(style)
 
@@ -1712,10 +1828,10 @@ class MainWindow(QMainWindow):
         clear_override_cursors_util()
         self.setCursor(Qt.ArrowCursor)
         self.unsetCursor()
-        self._set_interaction_cursors()
 
     def _restore_cursor_state_after_modal_deferred(self) -> None:
         self._reset_cursor_state_after_modal()
+        self._set_interaction_cursors()
 
     def _restore_cursor_state_after_modal(self) -> None:
         self._reset_cursor_state_after_modal()
@@ -2166,6 +2282,7 @@ class MainWindow(QMainWindow):
         return str(choice["mode"] or "")
 
     def _apply_windows_title_bar_theme(self, target: QWidget | None = None) -> None:
+        global _dwm_dark_mode_attribute
         if sys.platform != "win32":
             return
         widget = target or self
@@ -2176,15 +2293,21 @@ class MainWindow(QMainWindow):
         try:
             import ctypes
 
+            set_window_attribute = ctypes.windll.dwmapi.DwmSetWindowAttribute
             value = ctypes.c_int(use_dark_title_bar)
-            for attribute in (20, 19):  # DWMWA_USE_IMMERSIVE_DARK_MODE (newer, older)
-                result = ctypes.windll.dwmapi.DwmSetWindowAttribute(
+            if _dwm_dark_mode_attribute is not None:
+                attributes: tuple[int, ...] = (_dwm_dark_mode_attribute,)
+            else:
+                attributes = _DWM_DARK_MODE_ATTRIBUTES
+            for attribute in attributes:
+                result = set_window_attribute(
                     ctypes.c_void_p(hwnd),
                     ctypes.c_uint(attribute),
                     ctypes.byref(value),
                     ctypes.sizeof(value),
                 )
                 if result == 0:
+                    _dwm_dark_mode_attribute = attribute
                     break
         except Exception:
             return
@@ -2208,23 +2331,35 @@ class MainWindow(QMainWindow):
         default_index: int = -1,
         keep_enabled_when_empty: bool = False,
     ) -> int:
-        combo.blockSignals(True)
-        combo.clear()
-        for label, user_data in options:
-            combo.addItem(label, userData=user_data)
-
-        target_index = -1
-        for idx in range(combo.count()):
-            if combo.itemData(idx, role=Qt.UserRole) == selected:
-                target_index = idx
-                break
-
-        if target_index < 0 and default_index >= 0 and combo.count() > default_index:
-            target_index = default_index
-        if target_index >= 0:
-            combo.setCurrentIndex(target_index)
-
-        combo.blockSignals(False)
+        options = tuple(options)
+        with QSignalBlocker(combo):
+            if self._combo_options.get(combo) != options:
+                self._combo_options[combo] = options
+                combo.clear()
+                model = combo.model()
+                if isinstance(model, QStandardItemModel):
+                    items: list[QStandardItem] = []
+                    for label, user_data in options:
+                        item = QStandardItem(label)
+                        item.setData(user_data, Qt.UserRole)
+                        items.append(item)
+                    if items:
+                        model.invisibleRootItem().appendRows(items)
+                else:
+                    for label, user_data in options:
+                        combo.addItem(label, userData=user_data)
+
+            target_index = -1
+            for idx, (_label, user_data) in enumerate(options):
+                if user_data == selected:
+                    target_index = idx
+                    break
+
+            if target_index < 0 and default_index >= 0 and combo.count() > default_index:
+                target_index = default_index
+            if target_index >= 0:
+                combo.setCurrentIndex(target_index)
+
         combo.setEnabled(keep_enabled_when_empty or combo.count() > 0)
         return target_index
 
@@ -2272,10 +2407,9 @@ class MainWindow(QMainWindow):
         has_recording = bool(has_take)
         self._recording_active = is_active
         self._recording_has_take = has_recording
-        self.recording_toggle_button.blockSignals(True)
-        self.recording_toggle_button.setChecked(is_active)
-        self.recording_toggle_button.setText("Stop Recording" if is_active else "Start Recording")
-        self.recording_toggle_button.blockSignals(False)
+        with QSignalBlocker(self.recording_toggle_button):
+            self.recording_toggle_button.setChecked(is_active)
+            self.recording_toggle_button.setText("Stop Recording" if is_active else "Start Recording")
         self.recording_toggle_button.setEnabled(not self._recording_save_busy)
         self.save_recording_button.setText("Saving..." if self._recording_save_busy else "Save recording")
         self.save_recording_button.setEnabled(has_recording and not is_active and not self._recording_save_busy)
@@ -2288,48 +2422,60 @@ class MainWindow(QMainWindow):
 
     def set_recording_elapsed(self, seconds: int) -> None:
         total = max(0, int(seconds))
+        if total == self._recording_elapsed_seconds:
+            return
+        self._recording_elapsed_seconds = total
         minutes, secs = divmod(total, 60)
         self.recording_timer_label.setText(f"{minutes:02d}:{secs:02d}")
 
     @staticmethod
     def _set_slider_and_label(slider: QSlider, label: QLabel, value: int, text: str) -> None:
-        slider.blockSignals(True)
-        slider.setValue(int(value))
-        slider.blockSignals(False)
-        label.setText(text)
+        if slider.value() != int(value):
+            with QSignalBlocker(slider):
+                slider.setValue(int(value))
+        if label.text() != text:
+            label.setText(text)
 
     def set_volume(self, volume: float) -> None:
+        self._cancel_sound_emit("volumeChanged")
         value = int(round(max(0.0, min(1.0, volume)) * 100))
         self._set_slider_and_label(self.volume_slider, self.volume_value, value, f"{value}%")
 
     def set_velocity(self, value: int) -> None:
+        self._cancel_sound_emit("velocityChanged")
         clamped = max(1, min(127, int(value)))
         self._set_slider_and_label(self.velocity_slider, self.velocity_value, clamped, str(clamped))
 
     def set_transpose(self, value: int) -> None:
+        self._cancel_sound_emit("transposeChanged")
         clamped = max(-21, min(21, int(value)))
         self._set_slider_and_label(self.transpose_slider, self.transpose_value, clamped, f"{clamped:+d}")
 
     def set_sustain_percent(self, value: int) -> None:
+        self._cancel_sound_emit("sustainPercentChanged")
         clamped = max(0, min(100, int(value)))
         self._set_slider_and_label(self.sustain_slider, self.sustain_value, clamped, f"{clamped}%")
 
     def set_sustain_fade(self, value: int) -> None:
+        self._cancel_sound_emit("sustainFadeChanged")
         clamped = max(0, min(100, int(value)))
         self._set_slider_and_label(self.sustain_fade_slider, self.sustain_fade_value, clamped, f"{clamped}%")
 
     def set_hold_space_sustain_mode(self, enabled: bool) -> None:
-        self.hold_space_sustain_checkbox.blockSignals(True)
-        self.hold_space_sustain_checkbox.setChecked(bool(enabled))
-        self.hold_space_sustain_checkbox.blockSignals(False)
+        if self.hold_space_sustain_checkbox.isChecked() == bool(enabled):
+            return
+        with QSignalBlocker(self.hold_space_sustain_checkbox):
+            self.hold_space_sustain_checkbox.setChecked(bool(enabled))
 
     def set_label_visibility(self, show_key_labels: bool, show_note_labels: bool) -> None:
-        self.show_key_labels_checkbox.blockSignals(True)
-        self.show_note_labels_checkbox.blockSignals(True)
-        self.show_key_labels_checkbox.setChecked(bool(show_key_labels))
-        self.show_note_labels_checkbox.setChecked(bool(show_note_labels))
-        self.show_key_labels_checkbox.blockSignals(False)
-        self.show_note_labels_checkbox.blockSignals(False)
+        if (
+            self.show_key_labels_checkbox.isChecked() == bool(show_key_labels)
+            and self.show_note_labels_checkbox.isChecked() == bool(show_note_labels)
+        ):
+            return
+        with QSignalBlocker(self.show_key_labels_checkbox), QSignalBlocker(self.show_note_labels_checkbox):
+            self.show_key_labels_checkbox.setChecked(bool(show_key_labels))
+            self.show_note_labels_checkbox.setChecked(bool(show_note_labels))
 
     def set_keybind_edit_mode(self, active: bool, status_text: str = "") -> None:
         self._keybind_edit_active = bool(active)
@@ -2375,12 +2521,13 @@ class MainWindow(QMainWindow):
 
     def set_ui_scale(self, scale: float) -> None:
         clamped = max(UI_SCALE_MIN, min(UI_SCALE_MAX, float(scale)))
-        self._ui_scale = clamped
+        if clamped != self._ui_scale:
+            self._ui_scale = clamped
+            self._sp_cache.clear()
         self._applied_ui_scale = clamped
         slider_value = int(round((clamped - UI_SCALE_MIN) / UI_SCALE_STEP))
-        self.ui_scale_slider.blockSignals(True)
-        self.ui_scale_slider.setValue(slider_value)
-        self.ui_scale_slider.blockSignals(False)
+        with QSignalBlocker(self.ui_scale_slider):
+            self.ui_scale_slider.setValue(slider_value)
         self.ui_scale_value.setText(f"{int(round(clamped * 100.0))}%")
         self._apply_style()
         self._schedule_layout_refresh()
@@ -2389,25 +2536,26 @@ class MainWindow(QMainWindow):
         target = "classic" if str(style or "").strip().lower() == "classic" else "premium"
         self._piano_style = target
         self.piano_widget.set_piano_style(target)
-        for button in self.piano_style_buttons.values():
-            button.blockSignals(True)
-        self.piano_style_buttons[target].setChecked(True)
-        for button in self.piano_style_buttons.values():
-            button.blockSignals(False)
+        with ExitStack() as stack:
+            for button in self.piano_style_buttons.values():
+                stack.enter_context(QSignalBlocker(button))
+            self.piano_style_buttons[target].setChecked(True)
 
     def set_animation_speed(self, speed: str) -> None:
         target = speed if speed in ANIMATION_SPEED_LABELS else "instant"
-        self.anim_speed_combo.blockSignals(True)
-        for idx in range(self.anim_speed_combo.count()):
-            if self.anim_speed_combo.itemData(idx, role=Qt.UserRole) == target:
-                self.anim_speed_combo.setCurrentIndex(idx)
-                break
-        self.anim_speed_combo.blockSignals(False)
+        if self.anim_speed_combo.currentData(Qt.UserRole) == target:
+            return
+        with QSignalBlocker(self.anim_speed_combo):
+            for idx in range(self.anim_speed_combo.count()):
+                if self.anim_speed_combo.itemData(idx, role=Qt.UserRole) == target:
+                    self.anim_speed_combo.setCurrentIndex(idx)
+                    break
 
     def set_auto_check_updates(self, enabled: bool) -> None:
-        self.auto_updates_checkbox.blockSignals(True)
-        self.auto_updates_checkbox.setChecked(bool(enabled))
-        self.auto_updates_checkbox.blockSignals(False)
+        if self.auto_updates_checkbox.isChecked() == bool(enabled):
+            return
+        with QSignalBlocker(self.auto_updates_checkbox):
+            self.auto_updates_checkbox.setChecked(bool(enabled))
 
     def _readable_text_color(self, background: str) -> str:
         color = QColor(background)
@@ -2421,11 +2569,7 @@ class MainWindow(QMainWindow):
         return "#111111" if luminance > 0.54 else "#F5F5F5"
 
     def _build_key_color_button_style(self, background: str, text_color: str) -> str:
-        return (
-            f"background: {background}; color: {text_color}; border: 1px solid {self.theme.border}; "
-            f"border-radius: 6px; padding: {self._sp(4)}px {self._sp(10)}px; "
-            f"font: 600 {self._sp(10)}pt 'Segoe UI'; min-height: {self._sp(26)}px;"
-        )
+        return f"background: {background}; color: {text_color};"
     def _refresh_key_color_buttons(self) -> None:
         mapping = {
             "white_key": self.white_key_color_button,
@@ -2451,7 +2595,9 @@ class MainWindow(QMainWindow):
             label = labels.get(key, "Color")
             button.setText(f"{label} {color}")
             button.setToolTip(f"Current color: {color}")
-            button.setStyleSheet(self._build_key_color_button_style(color, text_color))
+            style = self._build_key_color_button_style(color, text_color)
+            if button.styleSheet() != style:
+                button.setStyleSheet(style)
 
     def set_key_color(self, target: str, color: str) -> None:
         if target not in self._key_color_values:
@@ -2466,7 +2612,7 @@ class MainWindow(QMainWindow):
         self._settings_visible = self._drawer_state.settings_visible
         self._controls_visible = self._drawer_state.controls_visible
         self.settings_scroll.setVisible(self._settings_visible)
-        self.controls_scroll.setVisible(self._controls_visible)
+        self.controls_container.setVisible(self._controls_visible)
         self.settings_toggle_button.setText("Hide Settings" if self._settings_visible else "Show Settings")
         self.controls_toggle_button.setText("Hide Controls" if self._controls_visible else "Show Controls")
         self._update_panel_divider_visibility()
@@ -2520,13 +2666,16 @@ class MainWindow(QMainWindow):
         self._sync_tutorial_overlay()
 
     def ensure_controls_target_visible(self, target: QWidget) -> None:
-        if not is_descendant_of(target, self.controls_scroll):
+        if not is_descendant_of(target, self.controls_container):
             return
         self._sync_tutorial_overlay()
 
     def set_tutorial_mode(self, active: bool) -> None:
         self._tutorial_mode = bool(active)
-        overlay = getattr(self, "_tutorial_overlay", None)
+        if self._tutorial_mode:
+            overlay = self._ensure_tutorial_overlay()
+        else:
+            overlay = getattr(self, "_tutorial_overlay", None)
         if overlay is None:
             return
         if self._tutorial_mode:
@@ -2546,9 +2695,7 @@ class MainWindow(QMainWindow):
         total: int,
         target_widget: QWidget | None,
     ) -> None:
-        overlay = getattr(self, "_tutorial_overlay", None)
-        if overlay is None:
-            return
+        overlay = self._ensure_tutorial_overlay()
         target_rect: QRect | None = None
         if target_widget is not None and target_widget.isVisible():
             top_left = target_widget.mapTo(self.centralWidget(), QPoint(0, 0))
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from functools import lru_cache
+
 from PySide6.QtCore import Qt
 from PySide6.QtWidgets import (
     QApplication,
@@ -14,6 +16,7 @@ from PySide6.QtWidgets import (
 from openpiano.core.theme import ThemePalette
 
 
+@lru_cache(maxsize=8)
 def message_box_stylesheet(theme: ThemePalette) -> str:
     return f"""
             QDialog, QMessageBox {{
@@ -19,6 +19,12 @@ def configure_controls_row(row: QHBoxLayout, scale: ScaleFunc) -> None:
     row.setSpacing(scale(6))
 
 
+def create_setting_label(text: str, parent: QWidget) -> QLabel:
+    label = QLabel(text, parent)
+    label.setObjectName("settingLabel")
+    return label
+
+
 def create_section_card(title: str, parent: QWidget) -> tuple[QFrame, QVBoxLayout]:
     card = QFrame(parent)
     card.setObjectName("settingsCard")
@@ -45,8 +51,7 @@ def add_labeled_slider_row(
 ) -> tuple[QSlider, QLabel]:
     row = QHBoxLayout()
     configure_settings_row(row, scale)
-    label = QLabel(label_text, parent)
-    label.setObjectName("settingLabel")
+    label = create_setting_label(label_text, parent)
     slider = QSlider(Qt.Horizontal, parent)
     slider.setObjectName(slider_object_name)
     slider.setRange(int(slider_range[0]), int(slider_range[1]))
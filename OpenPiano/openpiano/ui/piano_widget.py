@@ -1,11 +1,24 @@
 
 from __future__ import annotations
 
+from bisect import bisect_left, bisect_right
 from dataclasses import dataclass
-from typing import TYPE_CHECKING
-
-from PySide6.QtCore import QPoint, QPointF, QRectF, QSize, Qt, Signal
-from PySide6.QtGui import QColor, QFont, QFontMetrics, QLinearGradient, QMouseEvent, QPaintEvent, QPainter, QPainterPath, QPen
+from typing import TYPE_CHECKING, Callable
+
+from PySide6.QtCore import QLine, QPoint, QPointF, QRectF, QSize, Qt, Signal
+from PySide6.QtGui import (
+    QColor,
+    QFont,
+    QFontMetrics,
+    QLinearGradient,
+    QMouseEvent,
+    QPaintEvent,
+    QPainter,
+    QPainterPath,
+    QPen,
+    QPixmap,
+    QRegion,
+)
 from PySide6.QtWidgets import QWidget
 
 from openpiano.core.config import ANIMATION_PROFILE, DEFAULT_PIANO_STYLE, UI_SCALE_MAX, UI_SCALE_MIN
@@ -17,6 +30,16 @@ if TYPE_CHECKING:
     from openpiano.core.keymap import Binding, PianoMode
 
 
+_FILL_LUT_STEPS = 255
+_LABEL_DARK = QColor("#111827")
+_LABEL_LIGHT = QColor("#F6F6F6")
+_CLASSIC_WHITE_TOP_PEN = QPen(QColor("#FFFFFF"), 1)
+_CLASSIC_WHITE_BOTTOM_PEN = QPen(QColor("#C8C8CC"), 1)
+_CLASSIC_BLACK_OUTLINE_PEN = QPen(QColor("#000000"), 1)
+_CLASSIC_BLACK_TOP_PEN = QPen(QColor("#F5F5F5"), 1)
+_CLASSIC_BLACK_SIDE_PEN = QPen(QColor("#36363A"), 1)
+
+
 @dataclass(slots=True)
 class _KeyRect:
     note: int
@@ -48,7 +71,7 @@ def _readable_text_color(background: QColor) -> QColor:
         + (0.7152 * background.greenF())
         + (0.0722 * background.blueF())
     )
-    return QColor("#111827" if luminance > 0.54 else "#F6F6F6")
+    return _LABEL_DARK if luminance > 0.54 else _LABEL_LIGHT
 
 
 class PianoWidget(QWidget):
@@ -65,15 +88,22 @@ class PianoWidget(QWidget):
         self._mode: PianoMode = "61"
         self._ui_scale = 1.0
         self._animation_speed: AnimationSpeed = "instant"
+        self._anim_frames = 0
+        self._anim_step_magnitude = 0.0
         self._piano_style = DEFAULT_PIANO_STYLE
         self._show_key_labels = True
         self._show_note_labels = True
         self._mapping: dict[int, Binding] = {}
         self._labels: dict[int, str] = {}
+        self._hotkey_labels: dict[int, str] = {}
+        self._hotkey_lines: dict[int, list[str]] = {}
+        self._hotkey_multiline: dict[int, bool] = {}
         self._notes: list[int] = []
         self._white_note_count = 0
         self._white_rects: list[_KeyRect] = []
         self._black_rects: list[_KeyRect] = []
+        self._white_lefts: list[float] = []
+        self._black_lefts: list[float] = []
         self._rect_by_note: dict[int, QRectF] = {}
         self._pressed_notes: set[int] = set()
         self._mouse_pressed = False
@@ -82,7 +112,11 @@ class PianoWidget(QWidget):
         self._selected_keybind_note: int | None = None
         self._anim_t: dict[int, float] = {}
         self._anim_step: dict[int, float] = {}
-        self._anim_timer_id = self.startTimer(16)
+        self._key_pixmaps: dict[tuple[int, bool], QPixmap] = {}
+        self._key_pixmap_dpr = 0.0
+        self._label_fonts: dict[int, tuple[QFont, QFontMetrics]] = {}
+        self._fill_luts: dict[bool, list[QColor]] = {}
+        self._anim_timer_id = 0
         self.setMouseTracking(True)
 
     def _sp(self, value: int) -> int:
@@ -126,6 +160,8 @@ class PianoWidget(QWidget):
     def set_theme(self, theme: ThemePalette) -> None:
         self._base_theme = theme
         self._theme = theme
+        self._fill_luts.clear()
+        self._key_pixmaps.clear()
         self.update()
 
     def set_ui_scale(self, scale: float) -> None:
@@ -141,6 +177,13 @@ class PianoWidget(QWidget):
         self._mode = mode
         self._mapping = dict(mapping)
         self._labels = dict(labels)
+        self._hotkey_labels = {
+            note: binding_to_label(binding) for note, binding in self._mapping.items() if binding is not None
+        }
+        self._hotkey_lines = {
+            note: [line for line in text.split("\n") if line] for note, text in self._hotkey_labels.items()
+        }
+        self._hotkey_multiline = {note: "\n" in text for note, text in self._hotkey_labels.items()}
         self._notes = sorted(self._mapping.keys())
         self._white_note_count = sum(1 for note in self._notes if not is_black_key(note))
         if self._selected_keybind_note not in self._mapping:
@@ -148,6 +191,7 @@ class PianoWidget(QWidget):
         self._pressed_notes.clear()
         self._anim_t.clear()
         self._anim_step.clear()
+        self._stop_anim_timer()
         self._rebuild_geometry()
         self.updateGeometry()
         self.update()
@@ -166,23 +210,29 @@ class PianoWidget(QWidget):
         selected = note if isinstance(note, int) and note in self._mapping else None
         if selected == self._selected_keybind_note:
             return
+        previous = self._selected_keybind_note
         self._selected_keybind_note = selected
-        self.update()
+        self._update_note(previous)
+        self._update_note(selected)
 
     def set_label_visibility(self, show_key_labels: bool, show_note_labels: bool) -> None:
         self._show_key_labels = bool(show_key_labels)
         self._show_note_labels = bool(show_note_labels)
+        self._key_pixmaps.clear()
         self.update()
 
     def set_animation_speed(self, speed: str) -> None:
         speed_value = speed if speed in ANIMATION_PROFILE else "instant"
         self._animation_speed = speed_value                            
+        self._anim_frames = ANIMATION_PROFILE[speed_value][0]
+        self._anim_step_magnitude = 1.0 / max(1, self._anim_frames)
 
     def set_piano_style(self, style: str) -> None:
         target = "classic" if str(style or "").strip().lower() == "classic" else "premium"
         if target == self._piano_style:
             return
         self._piano_style = target
+        self._key_pixmaps.clear()
         self.update()
 
     def set_key_colors(self, white: str, white_pressed: str, black: str, black_pressed: str) -> None:
@@ -193,6 +243,8 @@ class PianoWidget(QWidget):
             black=black,
             black_pressed=black_pressed,
         )
+        self._fill_luts.clear()
+        self._key_pixmaps.clear()
         self.update()
 
     def set_pressed(self, note: int, pressed: bool) -> None:
@@ -208,39 +260,38 @@ class PianoWidget(QWidget):
         else:
             self._pressed_notes.discard(note)
 
-        frames, _, _, _ = ANIMATION_PROFILE[self._animation_speed]
-        if frames <= 0:
+        if self._anim_frames <= 0:
             self._anim_t[note] = 1.0 if target_pressed else 0.0
             self._anim_step.pop(note, None)
         else:
             start = self._anim_t.get(note, 1.0 if was_pressed else 0.0)
             self._anim_t[note] = start
-            self._anim_step[note] = (1.0 / max(1, frames)) * (1.0 if target_pressed else -1.0)
+            self._anim_step[note] = self._anim_step_magnitude * (1.0 if target_pressed else -1.0)
+            if self._anim_timer_id == 0:
+                self._anim_timer_id = self.startTimer(16)
+
+        self._update_note(note)
 
-        rect = self._rect_by_note.get(note)
+    def _update_note(self, note: int | None) -> None:
+        rect = self._rect_by_note.get(note) if note is not None else None
         if rect is not None:
             self.update(rect.toRect().adjusted(-2, -2, 2, 2))
 
     def note_at(self, pos: QPoint) -> int | None:
         point = QPointF(pos)
-        for item in self._black_rects:
-            if item.rect.contains(point):
-                return item.note
-        for item in self._white_rects:
-            if item.rect.contains(point):
-                return item.note
-        return None
+        note = self._key_at(self._black_rects, self._black_lefts, point)
+        if note is None:
+            note = self._key_at(self._white_rects, self._white_lefts, point)
+        return note
 
     def resizeEvent(self, event) -> None:                          
         super().resizeEvent(event)
         self._rebuild_geometry()
 
     def timerEvent(self, event) -> None:                          
-        if event.timerId() != self._anim_timer_id:
+        if self._anim_timer_id == 0 or event.timerId() != self._anim_timer_id:
             return super().timerEvent(event)
-        if not self._anim_step:
-            return
-        changed_rects: list[QRect] = []
+        changed = QRegion()
         for note, step in list(self._anim_step.items()):
             current = self._anim_t.get(note, 0.0)
             next_value = max(0.0, min(1.0, current + step))
@@ -250,14 +301,24 @@ class PianoWidget(QWidget):
                 self._anim_step.pop(note, None)
             rect = self._rect_by_note.get(note)
             if rect is not None:
-                changed_rects.append(rect.toRect().adjusted(-2, -2, 2, 2))
-        for rect in changed_rects:
-            self.update(rect)
+                changed += rect.toRect().adjusted(-2, -2, 2, 2)
+        if not changed.isEmpty():
+            self.update(changed)
+        if not self._anim_step:
+            self._stop_anim_timer()
+
+    def _stop_anim_timer(self) -> None:
+        if self._anim_timer_id != 0:
+            self.killTimer(self._anim_timer_id)
+            self._anim_timer_id = 0
 
     def _rebuild_geometry(self) -> None:
         self._white_rects.clear()
         self._black_rects.clear()
         self._rect_by_note.clear()
+        self._key_pixmaps.clear()
+        self._white_lefts.clear()
+        self._black_lefts.clear()
         if not self._notes:
             return
 
@@ -270,43 +331,77 @@ class PianoWidget(QWidget):
         left = float(self._side_margin())
 
         white_x_by_note: dict[int, float] = {}
+        prev_white_of: dict[int, int | None] = {}
+        last_white: int | None = None
         x = left
         for note in self._notes:
             if is_black_key(note):
+                prev_white_of[note] = last_white
                 continue
+            last_white = note
             rect = QRectF(x, top, white_w, white_h)
             self._white_rects.append(_KeyRect(note=note, rect=rect))
+            self._white_lefts.append(x)
             self._rect_by_note[note] = rect
             white_x_by_note[note] = x
             x += white_w + gap
 
-        for note in self._notes:
-            if not is_black_key(note):
-                continue
-            prev_white = note - 1
-            while prev_white >= self._notes[0] and is_black_key(prev_white):
-                prev_white -= 1
-            if prev_white not in white_x_by_note:
+        for note, prev_white in prev_white_of.items():
+            if prev_white is None:
                 continue
             center = white_x_by_note[prev_white] + white_w
             x1 = center - (black_w / 2.0)
             rect = QRectF(x1, top, black_w, black_h)
             self._black_rects.append(_KeyRect(note=note, rect=rect))
+            self._black_lefts.append(x1)
             self._rect_by_note[note] = rect
 
+    @staticmethod
+    def _keys_in_span(items: list[_KeyRect], lefts: list[float], left: float, right: float) -> list[_KeyRect]:
+        if not items:
+            return items
+        width = items[0].rect.width()
+        return items[bisect_left(lefts, left - width) : bisect_right(lefts, right)]
+
+    @staticmethod
+    def _key_at(items: list[_KeyRect], lefts: list[float], point: QPointF) -> int | None:
+        index = bisect_right(lefts, point.x())
+        for item in items[max(0, index - 2) : index]:
+            if item.rect.contains(point):
+                return item.note
+        return None
+
+    def _label_font(self, size: int) -> tuple[QFont, QFontMetrics]:
+        cached = self._label_fonts.get(size)
+        if cached is None:
+            font = QFont("Segoe UI", size, QFont.Weight.Bold)
+            cached = (font, QFontMetrics(font))
+            self._label_fonts[size] = cached
+        return cached
+
+    def _fill_lut(self, black: bool) -> list[QColor]:
+        lut = self._fill_luts.get(black)
+        if lut is None:
+            base = QColor(self._theme.black_key if black else self._theme.white_key)
+            pressed = QColor(self._theme.black_key_pressed if black else self._theme.white_key_pressed)
+            lut = [_lerp_color(base, pressed, step / _FILL_LUT_STEPS) for step in range(_FILL_LUT_STEPS + 1)]
+            self._fill_luts[black] = lut
+        return lut
+
     def _note_fill_color(self, note: int) -> QColor:
-        is_black = is_black_key(note)
-        base = QColor(self._theme.black_key if is_black else self._theme.white_key)
-        pressed = QColor(self._theme.black_key_pressed if is_black else self._theme.white_key_pressed)
         t = self._anim_t.get(note, 1.0 if note in self._pressed_notes else 0.0)
-        return _lerp_color(base, pressed, t)
+        return self._fill_lut(is_black_key(note))[int(round(t * _FILL_LUT_STEPS))]
 
     def paintEvent(self, event: QPaintEvent) -> None:                          
         clip = event.rect()
         clip_f = QRectF(clip)
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing, self._piano_style == "premium")
-        painter.setClipRegion(event.region())
+        region = event.region()
+        if region.rectCount() <= 1:
+            painter.setClipRect(clip)
+        else:
+            painter.setClipRegion(region)
 
         if not self._notes:
             painter.end()
@@ -318,79 +413,98 @@ class PianoWidget(QWidget):
             self._paint_classic(painter, clip_f)
         painter.end()
 
+    def _draw_cached_key(
+        self,
+        painter: QPainter,
+        item: _KeyRect,
+        draw_key: Callable[[QPainter, _KeyRect], None],
+    ) -> None:
+        t = self._pressed_amount(item.note)
+        if 0.0 < t < 1.0:
+            draw_key(painter, item)
+            return
+        dpr = self.devicePixelRatioF()
+        if dpr != self._key_pixmap_dpr:
+            self._key_pixmaps.clear()
+            self._key_pixmap_dpr = dpr
+        rect = item.rect
+        margin = self._sp(5) + 2
+        key = (item.note, t >= 1.0)
+        pixmap = self._key_pixmaps.get(key)
+        if pixmap is None:
+            width = int(rect.width()) + (margin * 2) + 1
+            height = int(rect.height()) + (margin * 2) + 1
+            pixmap = QPixmap(max(1, int(round(width * dpr))), max(1, int(round(height * dpr))))
+            pixmap.setDevicePixelRatio(dpr)
+            pixmap.fill(Qt.transparent)
+            key_painter = QPainter(pixmap)
+            key_painter.setRenderHint(QPainter.Antialiasing, self._piano_style == "premium")
+            key_painter.translate(margin - int(rect.left()), margin - int(rect.top()))
+            draw_key(key_painter, item)
+            key_painter.end()
+            self._key_pixmaps[key] = pixmap
+        painter.drawPixmap(QPoint(int(rect.left()) - margin, int(rect.top()) - margin), pixmap)
+
     def _paint_classic(self, painter: QPainter, clip_f: QRectF) -> None:
-        white_outline = QColor(self._theme.border)
-        white_top = QColor("#FFFFFF")
-        white_bottom = QColor("#C8C8CC")
-        white_outline_pen = QPen(white_outline, 1)
-        white_top_pen = QPen(white_top, 1)
-        white_bottom_pen = QPen(white_bottom, 1)
+        white_outline_pen = QPen(QColor(self._theme.border), 1)
         draw_labels = self._show_key_labels or self._show_note_labels
 
-                                
-        for item in self._white_rects:
+        def draw_white_key(key_painter: QPainter, item: _KeyRect) -> None:
             rect = item.rect
-            if not rect.intersects(clip_f):
-                continue
             fill = self._note_fill_color(item.note)
-            painter.fillRect(rect, fill)
-            painter.setPen(white_outline_pen)
-            painter.drawRect(rect)
-            painter.setPen(white_top_pen)
-            painter.drawLine(
+            key_painter.fillRect(rect, fill)
+            key_painter.setPen(white_outline_pen)
+            key_painter.drawRect(rect)
+            key_painter.setPen(_CLASSIC_WHITE_TOP_PEN)
+            key_painter.drawLine(
                 int(rect.left()) + 1,
                 int(rect.top()) + 1,
                 int(rect.right()) - 1,
                 int(rect.top()) + 1,
             )
-            painter.setPen(white_bottom_pen)
-            painter.drawLine(
+            key_painter.setPen(_CLASSIC_WHITE_BOTTOM_PEN)
+            key_painter.drawLine(
                 int(rect.left()) + 1,
                 int(rect.bottom()) - 1,
                 int(rect.right()) - 1,
                 int(rect.bottom()) - 1,
             )
             if draw_labels:
-                self._draw_labels(painter, item.note, rect, black=False)
-
-                                 
-        black_top = QColor("#F5F5F5")
-        black_side = QColor("#36363A")
-        black_outline_pen = QPen(QColor("#000000"), 1)
-        black_top_pen = QPen(black_top, 1)
-        black_side_pen = QPen(black_side, 1)
-        for item in self._black_rects:
+                self._draw_labels(key_painter, item.note, rect, black=False)
+
+        for item in self._keys_in_span(self._white_rects, self._white_lefts, clip_f.left(), clip_f.right()):
+            if item.rect.intersects(clip_f):
+                self._draw_cached_key(painter, item, draw_white_key)
+
+        def draw_black_key(key_painter: QPainter, item: _KeyRect) -> None:
             rect = item.rect
-            if not rect.intersects(clip_f):
-                continue
             fill = self._note_fill_color(item.note)
-            painter.fillRect(rect, fill)
-            painter.setPen(black_outline_pen)
-            painter.drawRect(rect)
-            painter.setPen(black_top_pen)
-            painter.drawLine(
+            key_painter.fillRect(rect, fill)
+            key_painter.setPen(_CLASSIC_BLACK_OUTLINE_PEN)
+            key_painter.drawRect(rect)
+            key_painter.setPen(_CLASSIC_BLACK_TOP_PEN)
+            key_painter.drawLine(
                 int(rect.left()) + 1,
                 int(rect.top()) + 1,
                 int(rect.right()) - 1,
                 int(rect.top()) + 1,
             )
-            painter.setPen(black_side_pen)
-            painter.drawLine(
-                int(rect.left()) + 1,
-                int(rect.top()) + 1,
-                int(rect.left()) + 1,
-                int(rect.bottom()) - 1,
-            )
-            painter.drawLine(
-                int(rect.right()) - 1,
-                int(rect.top()) + 1,
-                int(rect.right()) - 1,
-                int(rect.bottom()) - 1,
+            key_painter.setPen(_CLASSIC_BLACK_SIDE_PEN)
+            side_top = int(rect.top()) + 1
+            side_bottom = int(rect.bottom()) - 1
+            key_painter.drawLines(
+                [
+                    QLine(int(rect.left()) + 1, side_top, int(rect.left()) + 1, side_bottom),
+                    QLine(int(rect.right()) - 1, side_top, int(rect.right()) - 1, side_bottom),
+                ]
             )
             if draw_labels:
-                self._draw_labels(painter, item.note, rect, black=True)
+                self._draw_labels(key_painter, item.note, rect, black=True)
+
+        for item in self._keys_in_span(self._black_rects, self._black_lefts, clip_f.left(), clip_f.right()):
+            if item.rect.intersects(clip_f):
+                self._draw_cached_key(painter, item, draw_black_key)
 
-                                
         first = self._white_rects[0].rect
         last = self._white_rects[-1].rect
         outer = QRectF(
@@ -424,7 +538,7 @@ class PianoWidget(QWidget):
         base = QColor(self._theme.black_key if black else self._theme.white_key)
         pressed = QColor(self._theme.black_key_pressed if black else self._theme.white_key_pressed)
         t = self._pressed_amount(note)
-        mixed = _lerp_color(base, pressed, t)
+        mixed = self._fill_lut(black)[int(round(t * _FILL_LUT_STEPS))]
         gradient = QLinearGradient(rect.topLeft(), rect.bottomLeft())
         if black:
             gradient.setColorAt(0.00, mixed.lighter(145))
@@ -476,15 +590,13 @@ class PianoWidget(QWidget):
         white_right_separator = _with_alpha(QColor("#8B8377"), 34)
         white_bottom_tone = QColor("#948C7D")
 
-        for item in self._white_rects:
+        def draw_white_key(key_painter: QPainter, item: _KeyRect) -> None:
             rect = item.rect
-            if not rect.intersects(clip_f):
-                continue
             radius = float(self._sp(4))
             body = rect.adjusted(0.5, 0.5, -0.5, -0.5)
             path = self._rounded_path(body, radius)
-            painter.fillPath(path, self._premium_key_gradient(body, item.note, black=False))
-            self._draw_premium_backlight(painter, body, item.note, black=False)
+            key_painter.fillPath(path, self._premium_key_gradient(body, item.note, black=False))
+            self._draw_premium_backlight(key_painter, body, item.note, black=False)
             pressed_amount = self._pressed_amount(item.note)
             lower_tone_rect = body.adjusted(1.0, body.height() * 0.54, -1.0, -1.0)
             lower_tone = QLinearGradient(lower_tone_rect.topLeft(), lower_tone_rect.bottomLeft())
@@ -492,56 +604,65 @@ class PianoWidget(QWidget):
             lower_tone.setColorAt(0.00, _with_alpha(white_bottom_tone, 0))
             lower_tone.setColorAt(0.46, _with_alpha(white_bottom_tone, int(lower_alpha * 0.34)))
             lower_tone.setColorAt(1.00, _with_alpha(white_bottom_tone, lower_alpha))
-            painter.fillPath(self._rounded_path(lower_tone_rect, max(1.0, radius - 1.0)), lower_tone)
-            painter.setPen(QPen(white_edge, 1))
-            painter.drawPath(path)
-            painter.setPen(QPen(white_highlight, 1))
-            painter.drawLine(
+            key_painter.fillPath(self._rounded_path(lower_tone_rect, max(1.0, radius - 1.0)), lower_tone)
+            key_painter.setPen(QPen(white_edge, 1))
+            key_painter.drawPath(path)
+            key_painter.setPen(QPen(white_highlight, 1))
+            key_painter.drawLine(
                 QPointF(body.left() + self._sp(2), body.top() + self._sp(2)),
                 QPointF(body.right() - self._sp(2), body.top() + self._sp(2)),
             )
-            painter.setPen(QPen(white_left_glint, 1))
-            painter.drawLine(
+            key_painter.setPen(QPen(white_left_glint, 1))
+            key_painter.drawLine(
                 QPointF(body.left() + 1.0, body.top() + self._sp(4)),
                 QPointF(body.left() + 1.0, body.bottom() - self._sp(6)),
             )
-            painter.setPen(QPen(white_right_separator, 1))
-            painter.drawLine(
+            key_painter.setPen(QPen(white_right_separator, 1))
+            key_painter.drawLine(
                 QPointF(body.right() - 1.0, body.top() + self._sp(5)),
                 QPointF(body.right() - 1.0, body.bottom() - self._sp(5)),
             )
             if draw_labels:
-                self._draw_labels(painter, item.note, rect, black=False)
+                self._draw_labels(key_painter, item.note, rect, black=False)
+
+        for item in self._keys_in_span(self._white_rects, self._white_lefts, clip_f.left(), clip_f.right()):
+            if item.rect.intersects(clip_f):
+                self._draw_cached_key(painter, item, draw_white_key)
 
         shadow = QColor(0, 0, 0, 88)
         top_highlight = QColor(255, 255, 255, 82)
         side_highlight = QColor(255, 255, 255, 28)
         black_outline = QColor("#050506")
-        for item in self._black_rects:
+
+        def draw_black_key(key_painter: QPainter, item: _KeyRect) -> None:
             rect = item.rect
-            if not rect.adjusted(-2.0, -2.0, 2.0, self._sp(5)).intersects(clip_f):
-                continue
             radius = float(self._sp(3))
             shadow_rect = rect.adjusted(self._sp(1), self._sp(2), self._sp(1), self._sp(4))
-            painter.fillPath(self._rounded_path(shadow_rect, radius), _with_alpha(shadow, 58))
+            key_painter.fillPath(self._rounded_path(shadow_rect, radius), _with_alpha(shadow, 58))
             body = rect.adjusted(0.5, 0.5, -0.5, -0.5)
             path = self._rounded_path(body, radius)
-            painter.fillPath(path, self._premium_key_gradient(body, item.note, black=True))
-            self._draw_premium_backlight(painter, body, item.note, black=True)
-            painter.setPen(QPen(black_outline, 1))
-            painter.drawPath(path)
-            painter.setPen(QPen(top_highlight, 1))
-            painter.drawLine(
+            key_painter.fillPath(path, self._premium_key_gradient(body, item.note, black=True))
+            self._draw_premium_backlight(key_painter, body, item.note, black=True)
+            key_painter.setPen(QPen(black_outline, 1))
+            key_painter.drawPath(path)
+            key_painter.setPen(QPen(top_highlight, 1))
+            key_painter.drawLine(
                 QPointF(body.left() + self._sp(2), body.top() + self._sp(2)),
                 QPointF(body.right() - self._sp(2), body.top() + self._sp(2)),
             )
-            painter.setPen(QPen(side_highlight, 1))
-            painter.drawLine(
+            key_painter.setPen(QPen(side_highlight, 1))
+            key_painter.drawLine(
                 QPointF(body.left() + 1.0, body.top() + self._sp(4)),
                 QPointF(body.left() + 1.0, body.bottom() - self._sp(5)),
             )
             if draw_labels:
-                self._draw_labels(painter, item.note, rect, black=True)
+                self._draw_labels(key_painter, item.note, rect, black=True)
+
+        black_clip_margin = self._sp(5)
+        black_span = self._keys_in_span(self._black_rects, self._black_lefts, clip_f.left() - 2.0, clip_f.right() + 2.0)
+        for item in black_span:
+            if item.rect.adjusted(-2.0, -2.0, 2.0, black_clip_margin).intersects(clip_f):
+                self._draw_cached_key(painter, item, draw_black_key)
 
         first = self._white_rects[0].rect
         last = self._white_rects[-1].rect
@@ -565,9 +686,8 @@ class PianoWidget(QWidget):
             painter.drawRoundedRect(selected_rect.adjusted(1.0, 1.0, -1.0, -1.0), self._sp(4), self._sp(4))
 
     def _draw_labels(self, painter: QPainter, note: int, rect: QRectF, black: bool) -> None:
-        binding = self._mapping.get(note)
         note_text = self._labels.get(note, "")
-        hotkey_text = binding_to_label(binding) if binding is not None else ""
+        hotkey_text = self._hotkey_labels.get(note, "")
         if not self._show_key_labels:
             hotkey_text = ""
         if not self._show_note_labels:
@@ -579,24 +699,21 @@ class PianoWidget(QWidget):
 
         def draw_multiline_bottom(
             bottom: float,
-            text: str,
+            lines: list[str],
             font_size: int,
             line_height: int,
             line_gap: int,
         ) -> None:
-            lines = [line for line in text.split("\n") if line]
             if not lines:
                 return
             fitted_size = max(self._sp(6), int(font_size))
             width_limit = max(1, int(rect.width()) - self._sp(2))
             while fitted_size > self._sp(6):
-                font = QFont("Segoe UI", fitted_size, QFont.Weight.Bold)
-                metrics = QFontMetrics(font)
+                _, metrics = self._label_font(fitted_size)
                 if max(metrics.horizontalAdvance(line) for line in lines) <= width_limit:
                     break
                 fitted_size -= 1
-            draw_font = QFont("Segoe UI", fitted_size, QFont.Weight.Bold)
-            metrics = QFontMetrics(draw_font)
+            draw_font, metrics = self._label_font(fitted_size)
             lh = max(self._sp(9), int(line_height), metrics.height())
             gap = max(0, int(line_gap))
             line_step = max(self._sp(7), lh - gap)
@@ -620,12 +737,12 @@ class PianoWidget(QWidget):
             if hotkey_text and note_text:
                 draw_multiline_bottom(
                     hotkey_bottom,
-                    hotkey_text,
+                    self._hotkey_lines[note],
                     key_font_size,
                     self._sp(10),
                     self._sp(3),
                 )
-                painter.setFont(QFont("Segoe UI", note_font_size, QFont.Weight.Bold))
+                painter.setFont(self._label_font(note_font_size)[0])
                 painter.drawText(
                     QRectF(rect.left(), note_bottom - self._sp(14), rect.width(), self._sp(14)),
                     Qt.AlignHCenter | Qt.AlignBottom,
@@ -633,10 +750,10 @@ class PianoWidget(QWidget):
                 )
             else:
                 text = hotkey_text or note_text
-                if "\n" in text:
+                if hotkey_text and self._hotkey_multiline[note]:
                     draw_multiline_bottom(
                         rect.bottom() - self._sp(12),
-                        text,
+                        self._hotkey_lines[note],
                         key_font_size,
                         self._sp(10),
                         self._sp(3),
@@ -644,7 +761,7 @@ class PianoWidget(QWidget):
                 else:
                     text_font_size = key_font_size if hotkey_text else note_font_size
                     text_height = self._sp(18) if hotkey_text else self._sp(14)
-                    painter.setFont(QFont("Segoe UI", text_font_size, QFont.Weight.Bold))
+                    painter.setFont(self._label_font(text_font_size)[0])
                     painter.drawText(
                         QRectF(rect.left(), note_bottom - text_height, rect.width(), text_height),
                         Qt.AlignHCenter | Qt.AlignBottom,
@@ -660,12 +777,12 @@ class PianoWidget(QWidget):
         if hotkey_text and note_text:
             draw_multiline_bottom(
                 hotkey_bottom,
-                hotkey_text,
+                self._hotkey_lines[note],
                 hotkey_font_size,
                 self._sp(12),
                 self._sp(4),
             )
-            painter.setFont(QFont("Segoe UI", note_font_size, QFont.Weight.Bold))
+            painter.setFont(self._label_font(note_font_size)[0])
             painter.drawText(
                 QRectF(rect.left(), note_bottom - self._sp(18), rect.width(), self._sp(18)),
                 Qt.AlignHCenter | Qt.AlignBottom,
@@ -676,13 +793,13 @@ class PianoWidget(QWidget):
             if hotkey_text:
                 draw_multiline_bottom(
                     rect.bottom() - self._sp(12),
-                    hotkey_text,
+                    self._hotkey_lines[note],
                     hotkey_font_size,
                     self._sp(12),
                     self._sp(4),
                 )
             else:
-                painter.setFont(QFont("Segoe UI", note_font_size, QFont.Weight.Bold))
+                painter.setFont(self._label_font(note_font_size)[0])
                 painter.drawText(
                     QRectF(rect.left(), note_bottom - self._sp(18), rect.width(), self._sp(18)),
                     Qt.AlignHCenter | Qt.AlignBottom,
@@ -694,10 +811,12 @@ class PianoWidget(QWidget):
             return super().mousePressEvent(event)
         if self._keybind_edit_mode:
             note = self.note_at(event.position().toPoint())
+            previous = self._selected_keybind_note
             self._selected_keybind_note = note
             if note is not None:
                 self.keybindKeySelected.emit(note)
-            self.update()
+            self._update_note(previous)
+            self._update_note(note)
             event.accept()
             return
         note = self.note_at(event.position().toPoint())
@@ -10,6 +10,8 @@ class SpotlightOverlay(QWidget):
         super().__init__(parent)
         self._theme = theme
         self._target_rects: list[QRect] = []
+        self._spotlight_path: QPainterPath | None = None
+        self._spotlights: list[QRectF] = []
         self.setObjectName("spotlightOverlay")
         self.setAttribute(Qt.WA_TransparentForMouseEvents, True)
         self.setAutoFillBackground(False)
@@ -20,7 +22,11 @@ class SpotlightOverlay(QWidget):
         self.update()
 
     def set_target_rects(self, rects: list[QRect] | None) -> None:
-        self._target_rects = [QRect(rect) for rect in (rects or []) if isinstance(rect, QRect) and rect.isValid()]
+        target_rects = [QRect(rect) for rect in (rects or []) if isinstance(rect, QRect) and rect.isValid()]
+        if target_rects == self._target_rects:
+            return
+        self._target_rects = target_rects
+        self._spotlight_path = None
         self.update()
 
     def sync_to_parent(self) -> None:
@@ -30,18 +36,13 @@ class SpotlightOverlay(QWidget):
         self.setGeometry(parent.rect())
         self.update()
 
-    def paintEvent(self, event: QPaintEvent) -> None:
-        del event
-        if not self._target_rects:
-            return
-
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing, True)
+    def resizeEvent(self, event) -> None:
+        super().resizeEvent(event)
+        self._spotlight_path = None
 
-        full = QRectF(self.rect())
-        overlay_color = QColor(0, 0, 0, 178)
+    def _rebuild_spotlight_path(self) -> QPainterPath:
         path = QPainterPath()
-        path.addRect(full)
+        path.addRect(QRectF(self.rect()))
         spotlights: list[QRectF] = []
         for target in self._target_rects:
             spotlight = QRectF(target).adjusted(-6.0, -6.0, 6.0, 6.0)
@@ -50,10 +51,26 @@ class SpotlightOverlay(QWidget):
             spotlights.append(spotlight)
             path.addRoundedRect(spotlight, 8.0, 8.0)
         path.setFillRule(Qt.OddEvenFill)
+        self._spotlight_path = path
+        self._spotlights = spotlights
+        return path
+
+    def paintEvent(self, event: QPaintEvent) -> None:
+        del event
+        if not self._target_rects:
+            return
+
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing, True)
+
+        overlay_color = QColor(0, 0, 0, 178)
+        path = self._spotlight_path
+        if path is None:
+            path = self._rebuild_spotlight_path()
         painter.fillPath(path, overlay_color)
 
         pen = QPen(QColor(self._theme.accent_hover), 2)
         painter.setPen(pen)
-        for spotlight in spotlights:
+        for spotlight in self._spotlights:
             painter.drawRoundedRect(spotlight, 8.0, 8.0)
         painter.end()
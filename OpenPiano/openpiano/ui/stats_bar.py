@@ -15,6 +15,7 @@ class StatsBar(QFrame):
         self._theme = theme
         self._value_labels: dict[str, QLabel] = {}
         self._last_values: dict[str, str] = {}
+        self._last_snapshot: tuple[str, ...] = ()
         self._sustain_active = False
         self.setObjectName("statsBar")
 
@@ -56,14 +57,16 @@ class StatsBar(QFrame):
         self._apply_sustain_style()
 
     def set_values(self, values: dict[str, str], sustain_active: bool) -> None:
-        for key in STATS_ORDER:
-            label = self._value_labels.get(key)
-            if label is None:
-                continue
-            value_text = str(values.get(key, ""))
-            if self._last_values.get(key) != value_text:
-                label.setText(value_text)
-                self._last_values[key] = value_text
+        snapshot = tuple(str(values.get(key, "")) for key in STATS_ORDER)
+        if snapshot != self._last_snapshot:
+            self._last_snapshot = snapshot
+            for key, value_text in zip(STATS_ORDER, snapshot):
+                label = self._value_labels.get(key)
+                if label is None:
+                    continue
+                if self._last_values.get(key) != value_text:
+                    label.setText(value_text)
+                    self._last_values[key] = value_text
         sustain_state = bool(sustain_active)
         if sustain_state != self._sustain_active:
             self._sustain_active = sustain_state
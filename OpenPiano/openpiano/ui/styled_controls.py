@@ -1,7 +1,21 @@
 from __future__ import annotations
 
-from PySide6.QtCore import QPointF, QRect, QRectF, Qt, Signal
-from PySide6.QtGui import QColor, QPainter, QPalette, QPen
+from collections import OrderedDict
+
+from PySide6.QtCore import QEvent, QPoint, QPointF, QRect, QRectF, Qt, Signal
+from PySide6.QtGui import (
+    QBrush,
+    QColor,
+    QFont,
+    QFontMetrics,
+    QPainter,
+    QPainterPath,
+    QPalette,
+    QPen,
+    QPixmap,
+    QPixmapCache,
+    QPolygon,
+)
 from PySide6.QtWidgets import (
     QApplication,
     QComboBox,
@@ -11,7 +25,6 @@ from PySide6.QtWidgets import (
     QStyleOptionButton,
     QStyleOptionComboBox,
     QStyleOptionSlider,
-    QStyleOptionViewItem,
     QStyledItemDelegate,
     QWidget,
 )
@@ -33,18 +46,31 @@ class RoundHandleSliderStyle(QProxyStyle):
         self._border_color = QColor(border_color)
         self._groove_color = QColor(groove_color)
         self._fill_color = QColor(fill_color)
+        self._groove_brush = QBrush(self._groove_color)
+        self._fill_brush = QBrush(self._fill_color)
         self._handle_size = max(12, int(handle_size))
         self._groove_height = max(4, int(groove_height))
+        self._handle_pen_width = max(1, int(round(self._handle_size / 16)))
+        self._geom_cache_key: tuple | None = None
+        self._geom_cache_value: tuple[QRect, QRect, QRectF] | None = None
+        self._handle_pixmap: QPixmap | None = None
 
     def set_colors(self, *, handle_color: str, border_color: str, groove_color: str, fill_color: str) -> None:
         self._handle_color = QColor(handle_color)
         self._border_color = QColor(border_color)
         self._groove_color = QColor(groove_color)
         self._fill_color = QColor(fill_color)
+        self._groove_brush = QBrush(self._groove_color)
+        self._fill_brush = QBrush(self._fill_color)
+        self._handle_pixmap = None
 
     def set_metrics(self, *, handle_size: int, groove_height: int) -> None:
         self._handle_size = max(12, int(handle_size))
         self._groove_height = max(4, int(groove_height))
+        self._handle_pen_width = max(1, int(round(self._handle_size / 16)))
+        self._geom_cache_key = None
+        self._geom_cache_value = None
+        self._handle_pixmap = None
 
     def pixelMetric(self, metric, option=None, widget=None):
         if metric == QStyle.PixelMetric.PM_SliderLength:
@@ -56,30 +82,76 @@ class RoundHandleSliderStyle(QProxyStyle):
     def _handle_diameter(self) -> int:
         return self._handle_size
 
-    def _groove_rect(self, option: QStyleOptionSlider, widget: QWidget | None) -> QRect:
-        _ = widget
+    def _build_handle_pixmap(self, dpr: float) -> QPixmap:
+        diameter = self._handle_diameter()
+        margin = self._handle_pen_width
+        side = max(1, int(round((diameter + (margin * 2)) * dpr)))
+        pixmap = QPixmap(side, side)
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.transparent)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing, True)
+        painter.setBrush(self._handle_color)
+        painter.setPen(QPen(self._border_color, self._handle_pen_width))
+        painter.drawEllipse(QRectF(float(margin), float(margin), float(diameter), float(diameter)))
+        painter.end()
+        return pixmap
+
+    def _handle_pixmap_for(self, dpr: float) -> QPixmap:
+        pixmap = self._handle_pixmap
+        if pixmap is None or pixmap.devicePixelRatio() != dpr:
+            pixmap = self._build_handle_pixmap(dpr)
+            self._handle_pixmap = pixmap
+        return pixmap
+
+    def _geometry(self, option: QStyleOptionSlider) -> tuple[QRect, QRect, QRectF]:
+        rect = option.rect
+        key = (
+            rect.x(),
+            rect.y(),
+            rect.width(),
+            rect.height(),
+            option.minimum,
+            option.maximum,
+            option.sliderPosition,
+            option.upsideDown,
+            self._handle_size,
+            self._groove_height,
+        )
+        if key == self._geom_cache_key and self._geom_cache_value is not None:
+            return self._geom_cache_value
+
         diameter = self._handle_diameter()
         groove_h = self._groove_height
         inset = max(1, diameter // 2)
-        width = max(2, int(option.rect.width()) - (inset * 2))
-        x = int(option.rect.left()) + inset
-        y = int(option.rect.center().y() - (groove_h // 2))
-        return QRect(x, y, width, groove_h)
+        width = max(2, rect.width() - (inset * 2))
+        x = rect.left() + inset
+        y = rect.center().y() - (groove_h // 2)
+        groove = QRect(x, y, width, groove_h)
 
-    def _handle_rect(self, option: QStyleOptionSlider, widget: QWidget | None) -> QRect:
-        groove = self._groove_rect(option, widget)
-        diameter = self._handle_diameter()
         available = max(0, groove.width() - diameter)
         pos = QStyle.sliderPositionFromValue(
-            int(option.minimum),
-            int(option.maximum),
-            int(option.sliderPosition),
-            int(available),
-            bool(option.upsideDown),
+            option.minimum,
+            option.maximum,
+            option.sliderPosition,
+            available,
+            option.upsideDown,
         )
-        x = int(groove.left()) + int(pos)
-        y = int(groove.center().y() - (diameter // 2))
-        return QRect(x, y, diameter, diameter)
+        handle_x = groove.left() + pos
+        handle_y = groove.center().y() - (diameter // 2)
+        handle = QRect(handle_x, handle_y, diameter, diameter)
+
+        self._geom_cache_key = key
+        self._geom_cache_value = (groove, handle, QRectF(groove))
+        return self._geom_cache_value
+
+    def _groove_rect(self, option: QStyleOptionSlider, widget: QWidget | None) -> QRect:
+        _ = widget
+        return QRect(self._geometry(option)[0])
+
+    def _handle_rect(self, option: QStyleOptionSlider, widget: QWidget | None) -> QRect:
+        _ = widget
+        return QRect(self._geometry(option)[1])
 
     def subControlRect(self, control, option, sub_control, widget=None):
         if control == QStyle.ComplexControl.CC_Slider and isinstance(option, QStyleOptionSlider):
@@ -98,16 +170,15 @@ class RoundHandleSliderStyle(QProxyStyle):
             super().drawComplexControl(control, option, painter, widget)
             return
 
-        groove = self._groove_rect(option, widget)
-        handle = self._handle_rect(option, widget)
+        groove, handle, groove_f = self._geometry(option)
         radius = max(2.0, groove.height() / 2.0)
 
         painter.save()
         painter.setRenderHint(QPainter.Antialiasing, True)
 
         painter.setPen(Qt.NoPen)
-        painter.setBrush(self._groove_color)
-        painter.drawRoundedRect(QRectF(groove), radius, radius)
+        painter.setBrush(self._groove_brush)
+        painter.drawRoundedRect(groove_f, radius, radius)
 
         if handle.isValid():
             if option.upsideDown:
@@ -118,14 +189,14 @@ class RoundHandleSliderStyle(QProxyStyle):
                 fill_width = float(handle.center().x() - groove.left())
             if fill_width > 0:
                 fill_rect = QRectF(fill_left, float(groove.top()), fill_width, float(groove.height()))
-                painter.setBrush(self._fill_color)
+                painter.setBrush(self._fill_brush)
                 painter.drawRoundedRect(fill_rect, radius, radius)
 
         if handle.isValid():
-            circle_rect = QRectF(handle)
-            painter.setBrush(self._handle_color)
-            painter.setPen(QPen(self._border_color, max(1, int(round(self._handle_size / 16)))))
-            painter.drawEllipse(circle_rect)
+            device = painter.device()
+            dpr = float(device.devicePixelRatioF()) if device is not None else 1.0
+            margin = self._handle_pen_width
+            painter.drawPixmap(handle.left() - margin, handle.top() - margin, self._handle_pixmap_for(dpr))
 
         painter.restore()
 
@@ -141,20 +212,54 @@ class SquareCheckBoxStyle(QProxyStyle):
         radius: int = 4,
     ) -> None:
         super().__init__()
-        self._border_color = QColor(border_color)
-        self._fill_color = QColor(fill_color)
-        self._check_color = QColor(check_color)
         self._size = max(12, int(size))
         self._radius = max(2, int(radius))
+        self._check_pen_width = max(2, int(round(self._size / 9)))
+        self.set_colors(border_color=border_color, fill_color=fill_color, check_color=check_color)
+        self._check_path_cache: dict[tuple[int, int], QPainterPath] = {}
+        self._frame_path_cache: dict[tuple[int, int], QPainterPath] = {}
 
     def set_colors(self, *, border_color: str, fill_color: str, check_color: str) -> None:
         self._border_color = QColor(border_color)
         self._fill_color = QColor(fill_color)
         self._check_color = QColor(check_color)
+        self._border_disabled = QColor(self._border_color)
+        self._border_disabled.setAlpha(130)
+        self._fill_disabled = QColor(self._fill_color)
+        self._fill_disabled.setAlpha(110)
+        self._check_disabled = QColor(self._check_color)
+        self._check_disabled.setAlpha(170)
+        self._color_key = ":".join(
+            color.name(QColor.HexArgb) for color in (self._border_color, self._fill_color, self._check_color)
+        )
 
     def set_metrics(self, *, size: int, radius: int) -> None:
         self._size = max(12, int(size))
         self._radius = max(2, int(radius))
+        self._check_pen_width = max(2, int(round(self._size / 9)))
+        self._check_path_cache.clear()
+        self._frame_path_cache.clear()
+
+    def _frame_path(self, width: int, height: int) -> QPainterPath:
+        key = (width, height)
+        path = self._frame_path_cache.get(key)
+        if path is None:
+            path = QPainterPath()
+            path.addRoundedRect(QRectF(0.0, 0.0, float(width), float(height)), float(self._radius), float(self._radius))
+            self._frame_path_cache[key] = path
+        return path
+
+    def _check_path(self, width: int, height: int) -> QPainterPath:
+        key = (width, height)
+        path = self._check_path_cache.get(key)
+        if path is None:
+            w = float(width)
+            h = float(height)
+            path = QPainterPath(QPointF(w * 0.24, h * 0.56))
+            path.lineTo(w * 0.44, h * 0.74)
+            path.lineTo(w * 0.78, h * 0.34)
+            self._check_path_cache[key] = path
+        return path
 
     def pixelMetric(self, metric, option=None, widget=None):
         if metric in {QStyle.PixelMetric.PM_IndicatorWidth, QStyle.PixelMetric.PM_IndicatorHeight}:
@@ -184,104 +289,159 @@ class SquareCheckBoxStyle(QProxyStyle):
             return
 
         rect = option.rect.adjusted(1, 1, -2, -2)
+        if rect.width() <= 0 or rect.height() <= 0:
+            return
         checked = bool(option.state & QStyle.StateFlag.State_On)
         enabled = bool(option.state & QStyle.StateFlag.State_Enabled)
-        border = QColor(self._border_color)
-        fill = QColor(self._fill_color if checked else "transparent")
-        check = QColor(self._check_color)
-
-        if not enabled:
-            border.setAlpha(130)
-            fill.setAlpha(110 if checked else 0)
-            check.setAlpha(170)
-
-        painter.save()
+        device = painter.device()
+        dpr = float(device.devicePixelRatioF()) if device is not None else 1.0
+        key = (
+            f"opcb:{rect.width()}x{rect.height()}:{self._radius}:{dpr}:"
+            f"{self._color_key}:{int(checked)}{int(enabled)}"
+        )
+        pixmap = QPixmapCache.find(key)
+        if pixmap is None:
+            pixmap = self._build_indicator_pixmap(rect.width(), rect.height(), dpr, checked, enabled)
+            QPixmapCache.insert(key, pixmap)
+        painter.drawPixmap(rect.left() - 1, rect.top() - 1, pixmap)
+
+    def _build_indicator_pixmap(self, width: int, height: int, dpr: float, checked: bool, enabled: bool) -> QPixmap:
+        border = self._border_color if enabled else self._border_disabled
+        check = self._check_color if enabled else self._check_disabled
+
+        pixmap = QPixmap(max(1, int(round((width + 2) * dpr))), max(1, int(round((height + 2) * dpr))))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.transparent)
+        painter = QPainter(pixmap)
         painter.setRenderHint(QPainter.Antialiasing, True)
+        painter.translate(1, 1)
         painter.setPen(QPen(border, 1))
-        painter.setBrush(fill)
-        painter.drawRoundedRect(QRectF(rect), float(self._radius), float(self._radius))
+        if checked:
+            painter.setBrush(self._fill_color if enabled else self._fill_disabled)
+        else:
+            painter.setBrush(Qt.NoBrush)
+        painter.drawPath(self._frame_path(width, height))
 
         if checked:
-            pen_w = max(2, int(round(self._size / 9)))
-            pen = QPen(check, pen_w, Qt.SolidLine, Qt.RoundCap, Qt.RoundJoin)
+            pen = QPen(check, self._check_pen_width, Qt.SolidLine, Qt.RoundCap, Qt.RoundJoin)
             painter.setPen(pen)
-            x = float(rect.x())
-            y = float(rect.y())
-            w = float(rect.width())
-            h = float(rect.height())
-            p1 = QPointF(x + w * 0.24, y + h * 0.56)
-            p2 = QPointF(x + w * 0.44, y + h * 0.74)
-            p3 = QPointF(x + w * 0.78, y + h * 0.34)
-            painter.drawLine(p1, p2)
-            painter.drawLine(p2, p3)
-        painter.restore()
+            painter.setBrush(Qt.NoBrush)
+            painter.drawPath(self._check_path(width, height))
+        painter.end()
+        return pixmap
 
 
 class ComboPopupDelegate(QStyledItemDelegate):
+    _ELIDE_CACHE_LIMIT = 256
+
     def __init__(self, parent: QWidget | None = None) -> None:
         super().__init__(parent)
         palette = parent.palette() if isinstance(parent, QWidget) else QApplication.palette()
         self._accent = QColor("#D20F39")
-        self._text_color = QColor(palette.color(QPalette.Text))
-        self._panel_bg = QColor(palette.color(QPalette.Base))
-        hover_candidate = QColor(palette.color(QPalette.AlternateBase))
-        self._hover_bg = hover_candidate if hover_candidate.isValid() else QColor(self._panel_bg).darker(108)
+        self._text_color = palette.color(QPalette.Text)
+        self._text_color_disabled = QColor(self._text_color)
+        self._text_color_disabled.setAlpha(145)
+        self._panel_bg = palette.color(QPalette.Base)
+        hover_candidate = palette.color(QPalette.AlternateBase)
+        self._hover_bg = hover_candidate if hover_candidate.isValid() else self._panel_bg.darker(108)
         self._selected_bg = QColor(self._accent)
         self._selected_bg.setAlpha(42)
+        self._font_source: QFont | None = None
+        self._bold_font: QFont | None = None
+        self._bold_metrics: QFontMetrics | None = None
+        self._elide_cache: OrderedDict[tuple[str, int], str] = OrderedDict()
+        self._marker_path_cache: dict[int, tuple[int, QPainterPath]] = {}
+
+    def _bold_font_for(self, font: QFont) -> tuple[QFont, QFontMetrics]:
+        if self._bold_font is None or self._bold_metrics is None or self._font_source != font:
+            bold = QFont(font)
+            bold.setBold(True)
+            self._font_source = QFont(font)
+            self._bold_font = bold
+            self._bold_metrics = QFontMetrics(bold)
+            self._elide_cache.clear()
+        return self._bold_font, self._bold_metrics
+
+    def _marker_path(self, row_height: int) -> tuple[int, QPainterPath]:
+        cached = self._marker_path_cache.get(row_height)
+        if cached is None:
+            marker_width = max(3, int(round(row_height * 0.10)))
+            path = QPainterPath()
+            path.addRoundedRect(
+                QRectF(0.0, 0.0, float(marker_width), float(max(2, row_height - 8))),
+                marker_width / 2.0,
+                marker_width / 2.0,
+            )
+            cached = (marker_width, path)
+            self._marker_path_cache[row_height] = cached
+        return cached
+
+    def _elided_text(self, metrics: QFontMetrics, text: str, width: int) -> str:
+        key = (text, width)
+        cache = self._elide_cache
+        elided = cache.get(key)
+        if elided is not None:
+            cache.move_to_end(key)
+            return elided
+        elided = metrics.elidedText(text, Qt.TextElideMode.ElideRight, width)
+        cache[key] = elided
+        if len(cache) > self._ELIDE_CACHE_LIMIT:
+            cache.popitem(last=False)
+        return elided
 
     def set_colors(self, *, accent: str, text: str, panel: str, hover: str) -> None:
         self._accent = QColor(accent)
         self._text_color = QColor(text)
+        self._text_color_disabled = QColor(self._text_color)
+        self._text_color_disabled.setAlpha(145)
         self._panel_bg = QColor(panel)
         self._hover_bg = QColor(hover)
         self._selected_bg = QColor(accent)
         self._selected_bg.setAlpha(42)
+        self._font_source = None
+        self._bold_font = None
+        self._bold_metrics = None
 
     def paint(self, painter, option, index) -> None:
-        opt = QStyleOptionViewItem(option)
-        self.initStyleOption(opt, index)
-        rect = opt.rect
+        rect = option.rect
         if not rect.isValid():
             return
 
-        state = opt.state
+        state = option.state
         is_selected = bool(state & QStyle.StateFlag.State_Selected)
         is_hovered = bool(state & QStyle.StateFlag.State_MouseOver)
         is_enabled = bool(state & QStyle.StateFlag.State_Enabled)
 
         painter.save()
-        painter.setRenderHint(QPainter.Antialiasing, True)
-        painter.setPen(Qt.NoPen)
         if is_selected:
-            painter.setBrush(self._selected_bg)
+            row_bg = self._selected_bg
         elif is_hovered:
-            painter.setBrush(self._hover_bg)
+            row_bg = self._hover_bg
+        else:
+            row_bg = self._panel_bg
+        if row_bg.alpha() == 255:
+            painter.setCompositionMode(QPainter.CompositionMode_Source)
+            painter.fillRect(rect, row_bg)
+            painter.setCompositionMode(QPainter.CompositionMode_SourceOver)
         else:
-            painter.setBrush(self._panel_bg)
-        painter.drawRect(rect)
+            painter.fillRect(rect, row_bg)
 
         left_pad = 8
         if is_selected:
-            marker_width = max(3, int(round(rect.height() * 0.10)))
-            marker_rect = QRect(
-                int(rect.left() + 2),
-                int(rect.top() + 4),
-                marker_width,
-                max(2, int(rect.height() - 8)),
-            )
-            painter.setBrush(self._accent)
-            painter.drawRoundedRect(QRectF(marker_rect), marker_width / 2.0, marker_width / 2.0)
+            marker_width, marker_path = self._marker_path(rect.height())
+            painter.setRenderHint(QPainter.Antialiasing, True)
+            marker_origin = QPoint(rect.left() + 2, rect.top() + 4)
+            painter.translate(marker_origin)
+            painter.fillPath(marker_path, self._accent)
+            painter.translate(-marker_origin)
             left_pad += marker_width + 5
 
         text_rect = rect.adjusted(left_pad, 0, -6, 0)
-        text_color = QColor(self._text_color)
-        if not is_enabled:
-            text_color.setAlpha(145)
-        painter.setPen(text_color)
-        font = opt.font
-        font.setBold(True)
+        painter.setPen(self._text_color if is_enabled else self._text_color_disabled)
+        item_font = index.data(Qt.FontRole)
+        font, metrics = self._bold_font_for(item_font if isinstance(item_font, QFont) else option.font)
         painter.setFont(font)
-        text = opt.fontMetrics.elidedText(str(opt.text or ""), Qt.TextElideMode.ElideRight, max(1, text_rect.width()))
+        text = self._elided_text(metrics, str(index.data(Qt.DisplayRole) or ""), max(1, text_rect.width()))
         painter.drawText(text_rect, int(Qt.AlignVCenter | Qt.AlignLeft), text)
         painter.restore()
 
@@ -298,6 +458,13 @@ class ChevronComboBox(QComboBox):
         super().__init__(parent)
         self._arrow_idle = QColor("#B7B7BC")
         self._arrow_active = QColor("#F4F4F5")
+        self._popup_open = False
+        self._popup_container: QWidget | None = None
+        self._arrow_rect_cache: QRect | None = None
+        self._style_option = QStyleOptionComboBox()
+        self._chevron_points: tuple[QPolygon, QPolygon] | None = None
+        self._arrow_pen_width = max(1, int(round(self.height() / 12)))
+        self._arrow_pens: tuple[QPen, QPen] | None = None
         self._popup_delegate = ComboPopupDelegate(self)
         popup_view = QListView(self)
         popup_view.setUniformItemSizes(True)
@@ -308,66 +475,117 @@ class ChevronComboBox(QComboBox):
             popup_view.viewport().setMouseTracking(True)
         popup_view.setItemDelegate(self._popup_delegate)
         self.setView(popup_view)
+        self._popup_view = popup_view
 
     def set_arrow_colors(self, idle: str, active: str) -> None:
         self._arrow_idle = QColor(idle)
         self._arrow_active = QColor(active)
-        self.update()
+        self._arrow_pens = None
+        self._update_arrow()
+
+    def _arrow_rect(self) -> QRect:
+        if self._arrow_rect_cache is None:
+            option = self._style_option
+            self.initStyleOption(option)
+            self._arrow_rect_cache = self.style().subControlRect(
+                QStyle.ComplexControl.CC_ComboBox,
+                option,
+                QStyle.SubControl.SC_ComboBoxArrow,
+                self,
+            )
+            self._chevron_points = None
+        return self._arrow_rect_cache
+
+    def _chevron_polylines(self, arrow_rect: QRect) -> tuple[QPolygon, QPolygon]:
+        if self._chevron_points is None:
+            cx = arrow_rect.center().x()
+            cy = arrow_rect.center().y()
+            span = max(3, int(round(min(arrow_rect.width(), arrow_rect.height()) * 0.22)))
+            half = span // 2
+            closed = QPolygon([QPoint(cx - span, cy - half), QPoint(cx, cy + half), QPoint(cx + span, cy - half)])
+            opened = QPolygon([QPoint(cx - span, cy + half), QPoint(cx, cy - half), QPoint(cx + span, cy + half)])
+            self._chevron_points = (closed, opened)
+        return self._chevron_points
+
+    def _arrow_pen(self, active: bool) -> QPen:
+        if self._arrow_pens is None:
+            self._arrow_pens = tuple(
+                QPen(color, self._arrow_pen_width, Qt.SolidLine, Qt.RoundCap, Qt.RoundJoin)
+                for color in (self._arrow_idle, self._arrow_active)
+            )
+        return self._arrow_pens[active]
+
+    def _update_arrow(self) -> None:
+        arrow_rect = self._arrow_rect()
+        if arrow_rect.isValid():
+            self.update(arrow_rect)
+        else:
+            self.update()
+
+    def resizeEvent(self, event) -> None:
+        self._arrow_rect_cache = None
+        self._arrow_pen_width = max(1, int(round(self.height() / 12)))
+        self._arrow_pens = None
+        super().resizeEvent(event)
+
+    def changeEvent(self, event) -> None:
+        if event.type() in {QEvent.Type.StyleChange, QEvent.Type.FontChange, QEvent.Type.LayoutDirectionChange}:
+            self._arrow_rect_cache = None
+        super().changeEvent(event)
 
     def set_popup_colors(self, *, accent: str, text: str, panel: str, hover: str) -> None:
         self._popup_delegate.set_colors(accent=accent, text=text, panel=panel, hover=hover)
-        view = self.view()
-        if view is None:
-            return
+        view = self._popup_view
         palette = view.palette()
         palette.setColor(QPalette.Base, QColor(panel))
         palette.setColor(QPalette.Text, QColor(text))
         palette.setColor(QPalette.Highlight, QColor(accent))
         palette.setColor(QPalette.HighlightedText, QColor(text))
         view.setPalette(palette)
-        if view.viewport() is not None:
-            view.viewport().setPalette(palette)
-            view.viewport().update()
+        viewport = view.viewport()
+        if viewport is not None:
+            viewport.setPalette(palette)
+            viewport.update()
 
     def paintEvent(self, event) -> None:
+        if not self.isVisible() or event.region().isEmpty():
+            return
         super().paintEvent(event)
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing, True)
 
-        is_open = False
-        try:
-            view = self.view()
-            is_open = bool(view.isVisible()) if view is not None else False
-        except Exception:
-            is_open = False
-
-        color = self._arrow_active if (self.hasFocus() or is_open) else self._arrow_idle
-        pen_width = max(1, int(round(self.height() / 12)))
-        pen = QPen(color, pen_width, Qt.SolidLine, Qt.RoundCap, Qt.RoundJoin)
-        painter.setPen(pen)
-
-        option = QStyleOptionComboBox()
-        self.initStyleOption(option)
-        arrow_rect = self.style().subControlRect(
-            QStyle.ComplexControl.CC_ComboBox,
-            option,
-            QStyle.SubControl.SC_ComboBoxArrow,
-            self,
-        )
+        is_open = self._popup_open
+
+        painter.setPen(self._arrow_pen(self.hasFocus() or is_open))
+
+        arrow_rect = self._arrow_rect()
         if not arrow_rect.isValid():
             return
 
-        cx = arrow_rect.center().x()
-        cy = arrow_rect.center().y()
-        span = max(3, int(round(min(arrow_rect.width(), arrow_rect.height()) * 0.22)))
-
-        if is_open:
-            painter.drawLine(cx - span, cy + (span // 2), cx, cy - (span // 2))
-            painter.drawLine(cx, cy - (span // 2), cx + span, cy + (span // 2))
-        else:
-            painter.drawLine(cx - span, cy - (span // 2), cx, cy + (span // 2))
-            painter.drawLine(cx, cy + (span // 2), cx + span, cy - (span // 2))
+        closed, opened = self._chevron_polylines(arrow_rect)
+        painter.drawPolyline(opened if is_open else closed)
 
     def showPopup(self) -> None:
         self.popupAboutToShow.emit()
         super().showPopup()
+        view = self._popup_view
+        container = view.window()
+        if container is not None and container is not self.window() and container is not self._popup_container:
+            container.installEventFilter(self)
+            self._popup_container = container
+        self._set_popup_open(view.isVisible())
+
+    def hidePopup(self) -> None:
+        super().hidePopup()
+        self._set_popup_open(False)
+
+    def eventFilter(self, watched, event) -> bool:
+        if watched is self._popup_container and event.type() == QEvent.Type.Hide:
+            self._set_popup_open(False)
+        return super().eventFilter(watched, event)
+
+    def _set_popup_open(self, is_open: bool) -> None:
+        if is_open == self._popup_open:
+            return
+        self._popup_open = is_open
+        self._update_arrow()
@@ -1,13 +1,23 @@
 from __future__ import annotations
 
 from PySide6.QtCore import QPointF, Qt
-from PySide6.QtGui import QColor, QGuiApplication, QIcon, QPainter, QPen, QPixmap
+from PySide6.QtGui import QColor, QGuiApplication, QIcon, QPainter, QPainterPath, QPen, QPixmap, QPixmapCache, QTransform
 
 
 def build_theme_icon(*, mode: str, size: int, color: str) -> QIcon:
     icon_size = max(14, int(size))
     screen = QGuiApplication.primaryScreen()
     dpr = float(screen.devicePixelRatio()) if screen is not None else 1.0
+    icon_color = QColor(color).name(QColor.HexArgb)
+    key = f"optheme:{mode}:{icon_size}:{icon_color}:{dpr}"
+    pixmap = QPixmapCache.find(key)
+    if pixmap is None:
+        pixmap = _build_theme_icon_pixmap(mode, icon_size, icon_color, dpr)
+        QPixmapCache.insert(key, pixmap)
+    return QIcon(pixmap)
+
+
+def _build_theme_icon_pixmap(mode: str, icon_size: int, color: str, dpr: float) -> QPixmap:
     px = int(round(icon_size * dpr))
     icon = QPixmap(px, px)
     icon.setDevicePixelRatio(dpr)
@@ -26,43 +36,47 @@ def build_theme_icon(*, mode: str, size: int, color: str) -> QIcon:
         _draw_moon_icon(painter, center, icon_size, icon_color)
 
     painter.end()
-    return QIcon(icon)
+    return icon
 
 
-def _draw_sun_icon(painter: QPainter, center: QPointF, icon_size: int) -> None:
-    orbit_radius = icon_size * 0.22
-    inner_ray = icon_size * 0.34
-    outer_ray = icon_size * 0.46
-    painter.drawEllipse(
-        QPointF(center.x(), center.y()),
-        orbit_radius,
-        orbit_radius,
-    )
-    for direction in (
-        QPointF(1.0, 0.0),
-        QPointF(-1.0, 0.0),
-        QPointF(0.0, 1.0),
-        QPointF(0.0, -1.0),
-        QPointF(0.707, 0.707),
-        QPointF(-0.707, -0.707),
-        QPointF(0.707, -0.707),
-        QPointF(-0.707, 0.707),
+def _build_unit_sun_path() -> QPainterPath:
+    path = QPainterPath()
+    path.addEllipse(QPointF(0.5, 0.5), 0.22, 0.22)
+    for dx, dy in (
+        (1.0, 0.0),
+        (-1.0, 0.0),
+        (0.0, 1.0),
+        (0.0, -1.0),
+        (0.707, 0.707),
+        (-0.707, -0.707),
+        (0.707, -0.707),
+        (-0.707, 0.707),
     ):
-        start = QPointF(center.x() + (direction.x() * inner_ray), center.y() + (direction.y() * inner_ray))
-        end = QPointF(center.x() + (direction.x() * outer_ray), center.y() + (direction.y() * outer_ray))
-        painter.drawLine(start, end)
+        path.moveTo(0.5 + (dx * 0.34), 0.5 + (dy * 0.34))
+        path.lineTo(0.5 + (dx * 0.46), 0.5 + (dy * 0.46))
+    return path
+
+
+_UNIT_SUN_PATH = _build_unit_sun_path()
+
+
+def _draw_sun_icon(painter: QPainter, center: QPointF, icon_size: int) -> None:
+    # Scale the path rather than the painter so the pen width stays in device pixels.
+    offset_x = center.x() - (icon_size * 0.5)
+    offset_y = center.y() - (icon_size * 0.5)
+    transform = QTransform(icon_size, 0.0, 0.0, icon_size, offset_x, offset_y)
+    painter.drawPath(transform.map(_UNIT_SUN_PATH))
 
 
 def _draw_moon_icon(painter: QPainter, center: QPointF, icon_size: int, icon_color: QColor) -> None:
-    moon_radius = icon_size * 0.38
-    painter.setBrush(icon_color)
-    painter.drawEllipse(center, moon_radius, moon_radius)
-    painter.setCompositionMode(QPainter.CompositionMode_Clear)
-    painter.setPen(Qt.NoPen)
-    painter.setBrush(Qt.transparent)
-    painter.drawEllipse(
+    # Grow the disc by half the pen width so the fill covers what the outline stroke used to.
+    moon_radius = (icon_size * 0.38) + (painter.pen().widthF() * 0.5)
+    disc = QPainterPath()
+    disc.addEllipse(center, moon_radius, moon_radius)
+    cutout = QPainterPath()
+    cutout.addEllipse(
         QPointF(center.x() + (icon_size * 0.17), center.y() - (icon_size * 0.10)),
         icon_size * 0.34,
         icon_size * 0.34,
     )
-    painter.setCompositionMode(QPainter.CompositionMode_SourceOver)
+    painter.fillPath(disc.subtracted(cutout), icon_color)
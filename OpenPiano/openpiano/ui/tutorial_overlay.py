@@ -4,7 +4,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from PySide6.QtCore import QRect, QRectF, Qt, Signal
-from PySide6.QtGui import QColor, QKeyEvent, QPaintEvent, QPainter, QPainterPath, QPen
+from PySide6.QtGui import QColor, QKeyEvent, QPaintEvent, QPainter, QPainterPath, QPainterPathStroker
 from PySide6.QtWidgets import QFrame, QHBoxLayout, QLabel, QPushButton, QVBoxLayout, QWidget
 
 if TYPE_CHECKING:
@@ -22,6 +22,11 @@ class TutorialOverlay(QWidget):
         super().__init__(parent)
         self._theme = theme
         self._target_rect: QRect | None = None
+        self._spotlight_path: QPainterPath | None = None
+        self._spotlight = QRectF()
+        self._spotlight_outline = QPainterPath()
+        self._spotlight_color = QColor()
+        self._overlay_color = QColor(0, 0, 0, 178)
         self._panel_margin = 16
 
         self.setObjectName("tutorialOverlay")
@@ -80,6 +85,7 @@ class TutorialOverlay(QWidget):
 
     def set_theme(self, theme: ThemePalette) -> None:
         self._theme = theme
+        self._spotlight_color = QColor(theme.accent_hover)
         self._panel.setStyleSheet(
             f"""
             QFrame#tutorialPanel {{
@@ -139,6 +145,7 @@ class TutorialOverlay(QWidget):
 
     def set_target_rect(self, rect: QRect | None) -> None:
         self._target_rect = QRect(rect) if rect is not None else None
+        self._spotlight_path = None
         self._position_panel()
         self.update()
 
@@ -151,6 +158,7 @@ class TutorialOverlay(QWidget):
 
     def resizeEvent(self, event) -> None:                          
         super().resizeEvent(event)
+        self._spotlight_path = None
         self._position_panel()
 
     def keyPressEvent(self, event: QKeyEvent) -> None:                          
@@ -169,28 +177,38 @@ class TutorialOverlay(QWidget):
     def mouseReleaseEvent(self, event) -> None:                          
         event.accept()
 
+    def _rebuild_spotlight_path(self) -> QPainterPath:
+        self._spotlight = QRectF(self._target_rect).adjusted(-6.0, -6.0, 6.0, 6.0)
+        path = QPainterPath()
+        path.addRect(QRectF(self.rect()))
+        path.addRoundedRect(self._spotlight, 8.0, 8.0)
+        path.setFillRule(Qt.OddEvenFill)
+        outline = QPainterPath()
+        outline.addRoundedRect(self._spotlight, 8.0, 8.0)
+        stroker = QPainterPathStroker()
+        stroker.setWidth(2.0)
+        self._spotlight_outline = stroker.createStroke(outline)
+        self._spotlight_path = path
+        return path
+
     def paintEvent(self, event: QPaintEvent) -> None:                          
-        del event
+        exposed = event.rect()
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing, True)
-
-        full = QRectF(self.rect())
-        overlay_color = QColor(0, 0, 0, 178)
-        target_rect = QRectF(self._target_rect) if self._target_rect is not None else None
-
-        if target_rect is not None and target_rect.isValid():
-            spotlight = target_rect.adjusted(-6.0, -6.0, 6.0, 6.0)
-            path = QPainterPath()
-            path.addRect(full)
-            path.addRoundedRect(spotlight, 8.0, 8.0)
-            path.setFillRule(Qt.OddEvenFill)
-            painter.fillPath(path, overlay_color)
-
-            pen = QPen(QColor(self._theme.accent_hover), 2)
-            painter.setPen(pen)
-            painter.drawRoundedRect(spotlight, 8.0, 8.0)
+        painter.setClipRect(exposed)
+
+        if self._target_rect is not None and self._target_rect.isValid():
+            path = self._spotlight_path
+            if path is None:
+                path = self._rebuild_spotlight_path()
+            # The border stroke reaches just past the spotlight rect; exposures clear of it are a plain fill.
+            if exposed.intersects(self._spotlight.adjusted(-2.0, -2.0, 2.0, 2.0).toAlignedRect()):
+                painter.fillPath(path, self._overlay_color)
+                painter.setRenderHint(QPainter.Antialiasing, True)
+                painter.fillPath(self._spotlight_outline, self._spotlight_color)
+            else:
+                painter.fillRect(exposed, self._overlay_color)
         else:
-            painter.fillRect(self.rect(), overlay_color)
+            painter.fillRect(exposed, self._overlay_color)
 
         painter.end()
 